@@ -1,4 +1,6 @@
 # run.py
+import multiprocessing
 from veetech_app.main import main
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # needed for worker processes in the frozen EXE
     main()
\ No newline at end of file
@@ -0,0 +1,47 @@
+# tests/test_date_formatter.py
+
+import unittest
+
+from veetech_app.date_formatter import DateFormatter
+
+
+class FormatDateTest(unittest.TestCase):
+    """format_date normalizes dd/mm/yyyy-style dates to YYYYMMDD."""
+
+    CASES = [
+        # Zero-padded dates take the regex path
+        ("12/03/2024", "20240312"),
+        ("12-03-2024", "20240312"),
+        ("12.03.2024", "20240312"),
+        (" 12/03/2024 ", "20240312"),
+        ("29/02/2024", "20240229"),
+        ("29/02/2023", None),
+        ("31/04/2024", None),
+        ("00/01/2024", None),
+        ("01/13/2024", None),
+        ("01/01/0000", None),
+        # Years below 1000 are zero-padded on both paths
+        ("01/02/0999", "09990201"),
+        ("1/2/0999", "09990201"),
+        # Unpadded dates go through strptime
+        ("1/2/2024", "20240201"),
+        ("1-2-2024", "20240201"),
+        # The separator must be consistent
+        ("12/03-2024", None),
+        ("12/03/24", None),
+        # Non-ASCII digits get what strptime gives them, as before the regex path
+        ("١٢/03/2024", None),
+        ("12/03/٢٠٢٤", "20240312"),
+        ("", None),
+        (None, None),
+        ("not a date", None),
+    ]
+
+    def test_format_date(self):
+        for date_str, expected in self.CASES:
+            with self.subTest(date_str=date_str):
+                self.assertEqual(DateFormatter.format_date(date_str), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# tests/test_metadata_extractor.py
+
+import random
+import re
+import unittest
+
+from veetech_app.metadata_extractor import MetadataExtractor, PatternConfig
+
+
+def search_in_order(patterns, text, field_name):
+    """The original extract_field: the first pattern, in list order, that matches wins."""
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            return MetadataExtractor._clean_value(match.group(1), field_name)
+    return None
+
+
+class ExtractFieldTest(unittest.TestCase):
+    """extract_field and the combined scan must pick the same match as search_in_order."""
+
+    CASES = [
+        # Each field on its own
+        "Tag No: AB-12",
+        "Tag Number: PG-O12/3O",
+        "Serial No. S-100",
+        "Serial number|SN77",
+        "Unit ID: U-9",
+        "Date of Issue: 12/03/2024",
+        "TEST CERTIFICATE",
+        "certificate of calibration",
+        # Overlapping patterns: "Tag No" also matches the start of "Tag Number"
+        "Tag Number: XY-1",
+        # A later pattern matching earlier in the text loses to the first pattern
+        "Serial number: A-1 then Serial No: B-2",
+        "Tag Number: XY-1 Tag No: AB-2",
+        "TEST CERTIFICA' and CERTIFICATE OF CALIBRATION and TEST CERTIFICATE",
+        # Fields sharing text
+        "Tag No: AB-12 Serial No: S1 Unit ID: U1 Date of Issue: 01/02/2024 TEST CERTIFICATE",
+        "Tag No: N/A Serial No: NA",
+        # No match
+        "",
+        "nothing to see here",
+        "Tag No:",
+        # Uppercased-text path: ASCII text in any casing
+        "tAg nO: ab-12 SERIAL NO: s-1 unit id: u1 date OF issue: 01/02/2024",
+        # Non-ASCII text uses the IGNORECASE patterns
+        "Tag No: İ",
+        "Tag No: ıx Serial No: ſ1",
+        "Straße Tag No: AB-1",
+        "K Tag No: AB-1",
+    ]
+
+    TOKENS = [
+        "Tag No.", "Tag No:", "Tag Number", "Serial No.", "Serial number|", "Unit ID:",
+        "Date of Issue", "TEST CERTIFICATE", "test certificath", "TEST CERTIFICA'",
+        "CERTIFICATE OF CALIBRATION", " ", "\n", ": ", "+", "N/A", "AB-12", "KTO12",
+        "ab123", "12/03/2024", "x", "/", "-", "9", "İ", "ß",
+    ]
+
+    def assert_matches_in_order(self, text):
+        scanned = MetadataExtractor._scan_fields(text)
+        for key, field_name, patterns in PatternConfig.COMBINED_FIELDS:
+            expected = search_in_order(patterns, text, field_name)
+            with self.subTest(text=text, field=field_name):
+                self.assertEqual(MetadataExtractor.extract_field(patterns, text, field_name),
+                                 expected)
+                self.assertEqual(scanned[key], expected)
+
+    def test_cases(self):
+        for text in self.CASES:
+            self.assert_matches_in_order(text)
+
+    def test_random_texts(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            text = "".join(rng.choice(self.TOKENS) for _ in range(rng.randint(1, 20)))
+            self.assert_matches_in_order(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+# tests/test_ocr_processor.py
+
+import unittest
+
+from veetech_app.ocr_processor import OCRProcessor
+
+
+class CorrectOCRErrorsTest(unittest.TestCase):
+    """correct_ocr_errors must give the same text as applying each fix in turn."""
+
+    CASES = [
+        # A dashed "-5-" tag whose fields still need the KTOO fix
+        ("ABC-5-ktoo12-5-X", "ABC-5-KT0012-5-X"),
+        # Misread title followed by a certificate type broken over lines
+        ("TEST CERTTFICATE OF\nCALIBRATION", "TEST CERTIFICATE OF CALIBRATION"),
+        # Tag glued to the title; the tag must not swallow "TEST"
+        ("AB-12TEST CERTTFICATE", "AB-12TEST CERTIFICATE"),
+        # The title fix adds the word boundary the later dash fix needs
+        ("CALIBRATION-12-5-TESTCERTTFICATE5-5-1", "CALIBRATION-12-S-TEST CERTIFICATE5-5-1"),
+        ("KTOO12", "KT0012"),
+        ("AB-1O2 test certtficate", "AB-102 TEST CERTIFICATE"),
+        ("Certificate\r\nof  test", "CERTIFICATE OF TEST"),
+        ("Tag No: PG-O12/3O", "Tag No: PG-012/30"),
+        ("Tag No: AB-OO", "Tag No: AB-OO"),
+        ("plain text", "plain text"),
+    ]
+
+    def test_corrections(self):
+        for text, expected in self.CASES:
+            with self.subTest(text=text):
+                self.assertEqual(OCRProcessor.correct_ocr_errors(text), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
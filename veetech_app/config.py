@@ -1,8 +1,9 @@
 # veetech_app/config.py
 
 from dataclasses import dataclass
+from functools import lru_cache
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     """Application configuration settings."""
     app_name: str = "SplitMe"
@@ -13,3 +14,8 @@ class AppConfig:
     temp_dir: str = "veetech_temp"
     auto_check_updates: bool = True
     save_logs: bool = True
+
+@lru_cache(maxsize=None)
+def get_config() -> AppConfig:
+    """Return the shared application configuration."""
+    return AppConfig()
@@ -1,8 +1,35 @@
 # veetech_app/date_formatter.py
 
+import calendar
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
+# dd/mm/yyyy, dd-mm-yyyy or dd.mm.yyyy with a consistent separator, in ASCII
+# digits; other digits are left to strptime, which accepts only some of them
+_DATE_RE = re.compile(r"(\d{2})([/\-.])(\d{2})\2(\d{4})", re.ASCII)
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> Optional[str]:
+    """Parse a single date string; cached since batches repeat the same dates."""
+    if match := _DATE_RE.fullmatch(date_str):
+        day, month, year = int(match[1]), int(match[3]), int(match[4])
+        if year >= 1 and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]:
+            return f"{match[4]}{match[3]}{match[1]}"
+        return None
+
+    # Unpadded or otherwise unusual inputs still go through strptime. The
+    # year is padded by hand: strftime("%Y") leaves years below 1000 short on glibc
+    date_formats = ("%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y")
+    for fmt in date_formats:
+        try:
+            parsed = datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+        return f"{parsed.year:04d}{parsed.month:02d}{parsed.day:02d}"
+    return None
+
 class DateFormatter:
     """Handles date formatting operations."""
 
@@ -11,10 +38,4 @@ class DateFormatter:
         """Normalize various date formats to YYYYMMDD."""
         if not date_str:
             return None
-        date_formats = ("%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y")
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_str, fmt).strftime("%Y%m%d")
-            except ValueError:
-                continue
-        return None
+        return _parse_date(date_str.strip())
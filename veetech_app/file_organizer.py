@@ -1,43 +1,73 @@
 # veetech_app/file_organizer.py
 
+import errno
 import os
 import re
 import shutil
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
+MOVE_WORKERS = 8  # concurrent renames when grouping files into tag folders
+
 class FileOrganizer:
     """Handles file organization and grouping operations."""
 
+    # Used with Pattern.match, which anchors at the given position
+    _BASE_TAG_RE = re.compile(r"([A-Za-z]{2,5})-(\d+)", re.ASCII)
+
     @staticmethod
     def group_files_by_tag(output_dir: str, progress_callback=None) -> None:
         """Group PDF files into subfolders by base tag."""
-        moved_count = 0
-        pdf_files = [f for f in os.listdir(output_dir) if f.lower().endswith(".pdf")]
+        # scandir hands back file types with the listing, so no extra stat per file
+        with os.scandir(output_dir) as it:
+            # Cheap name check first; is_file only runs for PDF-named entries
+            pdf_entries = [entry for entry in it
+                           if entry.name[-4:].lower() == ".pdf"
+                           and entry.is_file(follow_symlinks=False)]
+        # Plain string joins; no Path objects are built per file
+        out = os.fspath(output_dir)
+        join = os.path.join
 
-        for i, filename in enumerate(pdf_files):
-            base_tag = FileOrganizer._extract_base_tag(filename)
+        moves = []
+        tags = set()
+        for entry in pdf_entries:
+            base_tag = FileOrganizer._extract_base_tag(entry.name)
             if not base_tag:
                 continue
-            dest_folder = Path(output_dir) / base_tag
-            dest_folder.mkdir(exist_ok=True)
+            tags.add(base_tag)
+            moves.append((entry.path, join(out, base_tag, entry.name)))
+        # Create every folder up front so the workers only rename
+        for base_tag in tags:
+            os.makedirs(join(out, base_tag), exist_ok=True)
 
-            src_path = Path(output_dir) / filename
-            dst_path = dest_folder / filename
-            shutil.move(str(src_path), str(dst_path))
-            moved_count += 1
+        # Each rename blocks in the kernel; overlap them across a few threads
+        total = len(moves)
+        with ThreadPoolExecutor(max_workers=MOVE_WORKERS) as pool:
+            futures = [pool.submit(FileOrganizer._move_file, src, dst) for src, dst in moves]
+            for done, future in enumerate(as_completed(futures), start=1):
+                future.result()
+                if progress_callback:
+                    progress_callback(f"Organizing files... {done}/{total}")
 
-            if progress_callback:
-                progress_callback(f"Organizing files... {i+1}/{len(pdf_files)}")
+    @staticmethod
+    def _move_file(src: str, dst: str) -> None:
+        """Rename src to dst, copying only if they are on different devices."""
+        try:
+            os.replace(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(src, dst)
 
     @staticmethod
     def _extract_base_tag(filename: str) -> Optional[str]:
         """Extract base tag from filename for grouping."""
-        parts = filename.split("_", 2)
-        if len(parts) < 2:
+        # The ID is the field after the first "_"; neither group can match "_",
+        # so matching in place never runs into the next field
+        idx = filename.find("_")
+        if idx < 0:
             return None
-        id_str = parts[1]
-        match = re.match(r"^([A-Za-z]{2,5})-(\d+)", id_str)
+        match = FileOrganizer._BASE_TAG_RE.match(filename, idx + 1)
         if match:
             return f"{match[1]}-{match[2]}"
         return None
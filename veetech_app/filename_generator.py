@@ -3,15 +3,31 @@
 from typing import Set
 from .metadata_extractor import CertificateMetadata
 
+# (has unit_id, has tag, has serial) -> standard core ID (unit_tag > tag > serial)
+_STANDARD_CORE_ID = {
+    (True, True, True): lambda m: f"{m.unit_id}_{m.tag}",
+    (True, True, False): lambda m: f"{m.unit_id}_{m.tag}",
+    (True, False, True): lambda m: m.unit_id,
+    (True, False, False): lambda m: m.unit_id,
+    (False, True, True): lambda m: m.tag,
+    (False, True, False): lambda m: m.tag,
+    (False, False, True): lambda m: m.serial,
+}
+
 class FilenameGenerator:
     """Generates standardized filenames for certificates."""
 
+    # Spaces and slashes both become "-"; applied in one pass over the name
+    _FILENAME_TABLE = str.maketrans({" ": "-", "/": "-"})
+
     @staticmethod
     def create_filename(metadata: CertificateMetadata, force_serial: bool = False) -> str:
         """Generate filename from metadata."""
         core_id = FilenameGenerator._build_core_id(metadata, force_serial)
-        filename = f"{metadata.issue_date}_{core_id.replace(' ', '-')}_{metadata.certificate_type}.pdf"
-        return filename.replace("/", "-")
+        # Only core_id can hold spaces: issue dates are YYYYMMDD and certificate
+        # types are space-free, so translating the whole name is equivalent
+        filename = f"{metadata.issue_date}_{core_id}_{metadata.certificate_type}.pdf"
+        return filename.translate(FilenameGenerator._FILENAME_TABLE)
 
     @staticmethod
     def _build_core_id(metadata: CertificateMetadata, force_serial: bool) -> str:
@@ -24,14 +40,11 @@ class FilenameGenerator:
     @staticmethod
     def _build_standard_core_id(metadata: CertificateMetadata) -> str:
         """Build standard core ID (unit_tag > tag > serial)."""
-        if metadata.unit_id:
-            return f"{metadata.unit_id}_{metadata.tag}" if metadata.tag else metadata.unit_id
-        elif metadata.tag:
-            return metadata.tag
-        elif metadata.serial:
-            return metadata.serial
-        else:
+        key = (bool(metadata.unit_id), bool(metadata.tag), bool(metadata.serial))
+        build = _STANDARD_CORE_ID.get(key)
+        if build is None:
             raise ValueError("No ID (tag/unit/serial) found")
+        return build(metadata)
 
     @staticmethod
     def _build_serial_based_core_id(metadata: CertificateMetadata) -> str:
@@ -2,17 +2,81 @@
 
 import sys
 import os
-import threading
-import tempfile
 import shutil
+import signal
+import subprocess
+import threading
+import multiprocessing
+import queue
+from collections import deque
+import time
 import traceback
-from datetime import datetime
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-from .config import AppConfig
+from .config import get_config
 from .logger import AppLogger
-from .update_manager import UpdateManager
-from .processor import VeetechProcessor, ProcessingResult
+
+if TYPE_CHECKING:
+    from .processor import ProcessingResult
+
+LOG_DRAIN_INTERVAL_MS = 50  # how often queued log lines are flushed into the log widget
+MAX_LOG_LINES = 2000        # oldest log lines are trimmed beyond this
+UI_PUMP_INTERVAL_MS = 20    # how often callbacks queued by worker threads are run
+UI_PUMP_BATCH = 64          # most queued callbacks run per pump tick
+PROCESS_POLL_INTERVAL_MS = 50  # how often events from the processing process are read
+CANCEL_TIMEOUT_MS = 10000      # grace for a cancelled pipeline to stop itself before it is killed
+EXIT_CANCEL_GRACE = 2.0        # seconds the same grace lasts when the app is closing
+SILENT_CHECK_DEADLINE = 8.0    # seconds after which a startup update check result is dropped
+# Keys that only move the cursor or selection in the read-only log
+LOG_NAVIGATION_KEYS = frozenset({
+    "Left", "Right", "Up", "Down", "Home", "End", "Prior", "Next",
+    "Shift_L", "Shift_R", "Control_L", "Control_R",
+})
+
+
+@lru_cache(maxsize=None)
+def _get_processor_cls():
+    """Import the processing pipeline on first use; it pulls in the PDF/OCR stack."""
+    from .processor import VeetechProcessor
+    return VeetechProcessor
+
+def _process_pdf_worker(input_file: str, events, fast_mode: bool = False,
+                        clean_output_dir: bool = False, cancel_event=None) -> None:
+    """
+    Run the processing pipeline in a child process, so OCR and PDF work never
+    hold the GIL the Tk thread needs. Reports ("started", (split_dir, ocr_output))
+    and ("progress", (message, fraction)), then ("done", ProcessingResult),
+    ("cancelled", None) once cancel_event stops the pipeline, or
+    ("error", (message, traceback)) on events.
+    """
+    if hasattr(os, "setpgrp"):
+        # Own process group, so a forced stop also reaches pool workers and OCR programs
+        os.setpgrp()
+    # A spawned child starts with no logging handlers; a forked one inherits them
+    if not logging.getLogger().handlers:
+        AppLogger(get_config())
+
+    def report(message: str, fraction: Optional[float] = None):
+        events.put(("progress", (message, fraction)))
+
+    from .processor import ProcessingCancelled
+    try:
+        processor = _get_processor_cls()(input_file, progress_callback=report,
+                                         clean_output_dir=clean_output_dir,
+                                         fast_mode=fast_mode, cancel_event=cancel_event)
+        # Lets the app remove the temporary files if it has to kill this process
+        events.put(("started", (processor.split_dir, processor.ocr_output)))
+        events.put(("done", processor.process()))
+    except ProcessingCancelled:
+        events.put(("cancelled", None))
+    except Exception as e:
+        events.put(("error", (f"Processing failed: {str(e)}", traceback.format_exc())))
+    finally:
+        # Children skip atexit, so flush the buffered log file here
+        logging.shutdown()
 
 
 def resource_path(rel_path: str) -> str:
@@ -25,23 +89,44 @@ class VeetechDesktopApp:
     """Main desktop application class."""
 
     def __init__(self):
-        self.config = AppConfig()
+        self.config = get_config()
         self.logger_manager = AppLogger(self.config)
         self.logger = AppLogger.get_logger(__name__)
 
         # Application state
         self.selected_file = None
         self.processing = False
+        self.processing_process = None
+        self._cancel_event = None
+        self._cancel_timer = None
+        self._process_files = ()
+
+        # Log lines and the latest status from any thread; drained on a Tk timer
+        # deque append/popleft are atomic, so no Queue locking per log line
+        self._log_queue = deque()
+        self._log_line_count = 0
+        self._pending_status = None
+        self._pending_fraction = None
+        # Callables from worker threads, run on the Tk thread by _pump
+        self._ui_queue = queue.Queue()
+
+        # Created on first use, see the update_manager property
+        self._update_manager = None
 
         # Setup GUI (defines self.root)
         self.setup_gui()
 
-        # Now that self.root exists, instantiate UpdateManager
-        self.update_manager = UpdateManager(self.config, root_window=self.root)
-
-        # Check for updates on startup
+        # Check for updates once the window is up rather than before it shows
         if self.config.auto_check_updates:
-            self.check_updates_silent()
+            self.root.after_idle(self.check_updates_silent)
+
+    @property
+    def update_manager(self):
+        """UpdateManager, imported and created on first use."""
+        if self._update_manager is None:
+            from .update_manager import UpdateManager
+            self._update_manager = UpdateManager(self.config, root_window=self.root)
+        return self._update_manager
 
     def setup_gui(self):
         """Setup the main GUI."""
@@ -72,6 +157,9 @@ class VeetechDesktopApp:
         self.create_action_buttons()
         self.create_menu()
 
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log)
+        self.root.after(UI_PUMP_INTERVAL_MS, self._pump)
+
     def setup_styles(self):
         style = ttk.Style()
         style.configure("Header.TLabel", font=("Segoe UI", 16, "bold"))
@@ -149,6 +237,14 @@ class VeetechDesktopApp:
             variable=self.force_ocr_var
         ).grid(row=2, column=0, sticky=tk.W, pady=2)
 
+        # Off: earlier output is kept and new files never take its names
+        self.clean_output_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            options_frame,
+            text="Clear previous output folder",
+            variable=self.clean_output_var
+        ).grid(row=3, column=0, sticky=tk.W, pady=2)
+
     def create_progress_section(self):
         progress_frame = ttk.LabelFrame(
             self.main_frame,
@@ -185,13 +281,17 @@ class VeetechDesktopApp:
         log_frame.rowconfigure(0, weight=1)
         self.main_frame.rowconfigure(5, weight=1)
 
+        # The widget stays in "normal" state so writes need no state toggling;
+        # user edits are blocked by bindings instead
         self.log_text = scrolledtext.ScrolledText(
             log_frame,
             height=10,
-            state="disabled",
             wrap=tk.WORD
         )
         self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.log_text.bind("<Key>", self._block_log_edit)
+        for sequence in ("<<Paste>>", "<<Cut>>", "<<Clear>>", "<Button-2>"):
+            self.log_text.bind(sequence, lambda e: "break")
 
         log_controls = ttk.Frame(log_frame)
         log_controls.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(5, 0))
@@ -304,65 +404,149 @@ class VeetechDesktopApp:
         self.process_button.config(state="disabled")
         self.cancel_button.config(state="normal")
         self.open_output_button.config(state="disabled")
-        self.progress_bar.start()
+        # Animate only until the processor reports real progress (OCR and
+        # splitting report none); a 100 ms step halves the redraws of the default
+        self.progress_bar.config(mode="indeterminate")
+        self.progress_var.set(0)
+        self.progress_bar.start(100)
 
         self.clear_log()
         self.log_message("Starting PDF processing...")
 
-        # Start processing thread
-        self.processing_thread = threading.Thread(
-            target=self.process_pdf_thread,
-            daemon=True
+        # Run the pipeline in its own process and poll its events from Tk
+        self._process_events = multiprocessing.Queue()
+        self._cancel_event = multiprocessing.Event()
+        self._process_files = ()
+        self.processing_process = multiprocessing.Process(
+            target=_process_pdf_worker,
+            # Unticking "Force OCR" lets PDFs that already have text skip full re-OCR
+            args=(self.selected_file, self._process_events, not self.force_ocr_var.get(),
+                  self.clean_output_var.get(), self._cancel_event)
         )
-        self.processing_thread.start()
-
-    def process_pdf_thread(self):
-        """Execute PDF processing in separate thread."""
-        try:
-            processor = VeetechProcessor(
-                self.selected_file,
-                progress_callback=self.update_progress_safe
-            )
-            result = processor.process()
-            self.root.after(0, self.processing_complete, result)
-        except Exception as e:
-            error_msg = f"Processing failed: {str(e)}"
-            self.logger.error(error_msg)
-            self.logger.error(traceback.format_exc())
-            self.root.after(0, self.processing_error, error_msg)
+        self.processing_process.start()
+        self.root.after(PROCESS_POLL_INTERVAL_MS, self._drain_process_events)
 
-    def update_progress_safe(self, message: str):
-        self.root.after(0, self.update_progress, message)
+    def _drain_process_events(self):
+        """Dispatch events from the processing process, then reschedule while it runs."""
+        process = self.processing_process
+        if process is None:
+            return
+        # Checked before draining: a child's queued events are flushed before it exits
+        alive = process.is_alive()
+        while True:
+            try:
+                kind, payload = self._process_events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                self.update_progress_safe(*payload)
+            elif kind == "started":
+                self._process_files = payload
+            elif kind == "cancelled":
+                self._finish_process()
+                self.processing_cancelled()
+                return
+            elif kind == "done":
+                self._finish_process()
+                self.processing_complete(payload)
+                return
+            else:
+                error_msg, details = payload
+                self.logger.error(error_msg)
+                self.logger.error(details)
+                self._finish_process()
+                self.processing_error(error_msg)
+                return
+        if not alive:
+            self._finish_process()
+            if self._cancel_event.is_set():
+                self.processing_cancelled()
+                return
+            self.processing_error(f"Processing stopped unexpectedly (exit code {process.exitcode})")
+            return
+        self.root.after(PROCESS_POLL_INTERVAL_MS, self._drain_process_events)
 
-    def update_progress(self, message: str):
-        """Update progress display."""
-        self.status_var.set(message)
+    def _finish_process(self, terminate: bool = False):
+        """Reap the processing process, killing it first if asked."""
+        process = self.processing_process
+        if process is None:
+            return
+        self.processing_process = None
+        if self._cancel_timer is not None:
+            self.root.after_cancel(self._cancel_timer)
+            self._cancel_timer = None
+        if terminate and process.is_alive():
+            self._kill_process_tree(process)
+        process.join()
+        self._process_events.close()
+        if process.exitcode != 0:
+            # Killed or crashed, so the pipeline's own cleanup may not have run
+            split_dir, ocr_output = self._process_files or (None, None)
+            if split_dir:
+                shutil.rmtree(split_dir, ignore_errors=True)
+            if ocr_output:
+                try:
+                    os.remove(ocr_output)
+                except FileNotFoundError:
+                    pass
+        self._process_files = ()
+
+    @staticmethod
+    def _kill_process_tree(process: multiprocessing.Process) -> None:
+        """Kill the processing process along with the processes it started."""
+        if sys.platform == "win32":
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(process.pid)],
+                           capture_output=True, creationflags=subprocess.CREATE_NO_WINDOW)
+        else:
+            try:
+                # Only once the child has made its own group; else the app's would be hit
+                if os.getpgid(process.pid) == process.pid:
+                    os.killpg(process.pid, signal.SIGKILL)
+            except OSError:
+                pass
+        if process.is_alive():
+            process.kill()
+
+    def update_progress_safe(self, message: str, fraction: Optional[float] = None):
+        # Runs on the Tk thread for each progress event the process poll reads;
+        # only the newest status is shown on the next drain
+        if fraction is not None:
+            self._pending_fraction = fraction
+        if not (self._cancel_event and self._cancel_event.is_set()):
+            # Keep "Cancelling..." up until the pipeline has stopped
+            self._pending_status = message
         self.log_message(message)
-        self.root.update_idletasks()
 
-    def processing_complete(self, result: ProcessingResult):
+    def processing_complete(self, result: "ProcessingResult"):
         """Handle successful processing completion."""
         self.processing = False
+        self._pending_status = None
+        self._pending_fraction = None
         self.progress_bar.stop()
+        self._show_fraction(1.0)
         self.process_button.config(state="normal")
         self.cancel_button.config(state="disabled")
         self.open_output_button.config(state="normal")
 
         self.status_var.set("Processing complete!")
-        self.log_message("=" * 50)
-        self.log_message("PROCESSING RESULTS:")
-        self.log_message(f"Total certificates: {result.total_chunks}")
-        self.log_message(f"Successfully processed: {result.successful}")
-        self.log_message(f"Failed: {result.failed}")
-
+        lines = [
+            "=" * 50,
+            "PROCESSING RESULTS:",
+            f"Total certificates: {result.total_chunks}",
+            f"Successfully processed: {result.successful}",
+            f"Failed: {result.failed}",
+        ]
         if result.errors:
-            self.log_message("\nERRORS ENCOUNTERED:")
-            for chunk_path, start, end, error in result.errors:
-                chunk_name = os.path.basename(chunk_path)
-                self.log_message(f"- {chunk_name} (pages {start+1}-{end}): {error}")
-
-        self.log_message(f"\nOutput directory: {result.output_directory}")
-        self.log_message("=" * 50)
+            lines.append("\nERRORS ENCOUNTERED:")
+            lines.extend(
+                f"- {os.path.basename(chunk_path)} (pages {start+1}-{end}): {error}"
+                for chunk_path, start, end, error in result.errors
+            )
+        lines.append(f"\nOutput directory: {result.output_directory}")
+        lines.append("=" * 50)
+        self.log_messages(lines)
+        # Show the summary before the (modal) result dialog opens
+        self._flush_log()
 
         success_rate = (result.successful / result.total_chunks) * 100 if result.total_chunks > 0 else 0
         if result.failed == 0:
@@ -385,6 +569,8 @@ class VeetechDesktopApp:
     def processing_error(self, error_msg: str):
         """Handle processing error."""
         self.processing = False
+        self._pending_status = None
+        self._pending_fraction = None
         self.progress_bar.stop()
         self.process_button.config(state="normal")
         self.cancel_button.config(state="disabled")
@@ -393,27 +579,61 @@ class VeetechDesktopApp:
         messagebox.showerror("Processing Error", error_msg)
 
     def cancel_processing(self):
-        """Cancel ongoing processing."""
-        if self.processing:
-            self.processing = False
-            self.progress_bar.stop()
-            self.process_button.config(state="normal")
+        """Ask the pipeline to stop; it is killed if it has not within CANCEL_TIMEOUT_MS."""
+        if self.processing and self.processing_process is not None \
+                and not self._cancel_event.is_set():
+            # The pipeline stops at its next stage or chunk and cleans up after
+            # itself; the event poll then reports it as cancelled
+            self._cancel_event.set()
+            self._cancel_timer = self.root.after(CANCEL_TIMEOUT_MS, self._force_stop)
             self.cancel_button.config(state="disabled")
-            self.status_var.set("Processing cancelled")
-            self.log_message("Processing cancelled by user")
+            self._pending_status = None
+            self.status_var.set("Cancelling...")
+            self.log_message("Cancelling processing...")
+
+    def _force_stop(self):
+        """Kill a cancelled pipeline that did not stop in time."""
+        self._cancel_timer = None
+        self.log_message("Processing did not stop in time; stopping it forcibly")
+        self._finish_process(terminate=True)
+        self.processing_cancelled()
+
+    def processing_cancelled(self):
+        """Reset the UI once the pipeline has stopped after a cancel."""
+        self.processing = False
+        self._pending_status = None
+        self._pending_fraction = None
+        self.progress_bar.stop()
+        self.process_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+        self.status_var.set("Processing cancelled")
+        self.log_message("Processing cancelled by user")
 
     def open_output_folder(self):
         """Open the output folder in Windows Explorer."""
-        if hasattr(self, "last_output_dir") and os.path.exists(self.last_output_dir):
-            os.startfile(self.last_output_dir)
-        else:
+        if not hasattr(self, "last_output_dir"):
             messagebox.showwarning("Warning", "No output folder available.")
+            return
+
+        # exists() and startfile() can stall on slow or network drives, so run
+        # them off the Tk thread and report back through the UI queue
+        output_dir = self.last_output_dir
+
+        def open_thread():
+            if os.path.exists(output_dir):
+                os.startfile(output_dir)
+            else:
+                self._ui_queue.put(lambda: messagebox.showwarning(
+                    "Warning", "No output folder available."))
+
+        threading.Thread(target=open_thread, daemon=True).start()
 
     def clear_log(self):
         """Clear the log display."""
-        self.log_text.config(state="normal")
+        # Drop queued lines too, or they would reappear on the next drain
+        self._log_queue.clear()
         self.log_text.delete(1.0, tk.END)
-        self.log_text.config(state="disabled")
+        self._log_line_count = 0
 
     def save_log(self):
         """Save log content to file."""
@@ -423,22 +643,96 @@ class VeetechDesktopApp:
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
         )
         if filename:
-            try:
-                log_content = self.log_text.get(1.0, tk.END)
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write(log_content)
-                messagebox.showinfo("Success", f"Log saved to:\n{filename}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to save log:\n{str(e)}")
+            self._flush_log()
+            log_content = self.log_text.get(1.0, tk.END)
+
+            # Write on a worker thread so a slow destination does not freeze the window
+            def save_thread():
+                try:
+                    with open(filename, "w", encoding="utf-8") as f:
+                        f.write(log_content)
+                    self._ui_queue.put(lambda: messagebox.showinfo(
+                        "Success", f"Log saved to:\n{filename}"))
+                except Exception as e:
+                    error_msg = f"Failed to save log:\n{str(e)}"
+                    self._ui_queue.put(lambda: messagebox.showerror("Error", error_msg))
+
+            threading.Thread(target=save_thread, daemon=True).start()
 
     def log_message(self, message: str):
-        """Add message to log display."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}\n"
-        self.log_text.config(state="normal")
-        self.log_text.insert(tk.END, formatted_message)
-        self.log_text.see(tk.END)
-        self.log_text.config(state="disabled")
+        """Queue message for the log display; safe to call from any thread."""
+        lt = time.localtime()
+        self._log_queue.append(f"[{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}] {message}\n")
+
+    def log_messages(self, messages):
+        """Queue several messages as one log entry sharing a timestamp."""
+        lt = time.localtime()
+        prefix = f"[{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}] "
+        self._log_queue.append("".join(f"{prefix}{message}\n" for message in messages))
+
+    def _drain_log(self):
+        """Flush queued log lines and status, then reschedule."""
+        self._flush_log()
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log)
+
+    def _pump(self):
+        """Run callbacks queued by worker threads, then reschedule."""
+        try:
+            for _ in range(UI_PUMP_BATCH):
+                try:
+                    callback = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                callback()
+        finally:
+            # A failing callback must not stop the pump
+            self.root.after(UI_PUMP_INTERVAL_MS, self._pump)
+
+    def _flush_log(self):
+        """Write all queued log lines to the widget in a single insert."""
+        status = self._pending_status
+        if status is not None:
+            self._pending_status = None
+            self.status_var.set(status)
+        fraction = self._pending_fraction
+        if fraction is not None:
+            self._pending_fraction = None
+            self._show_fraction(fraction)
+
+        # Only this (Tk) thread pops, so everything counted here is there to take
+        pending = len(self._log_queue)
+        if not pending:
+            return
+        popleft = self._log_queue.popleft
+        text = "".join([popleft() for _ in range(pending)])
+
+        # Only follow new output if the user has not scrolled up
+        at_bottom = self.log_text.yview()[1] >= 1.0
+        self.log_text.insert(tk.END, text)
+        # Keep the Text widget bounded by dropping the oldest lines in one delete
+        self._log_line_count += text.count("\n")
+        excess = self._log_line_count - MAX_LOG_LINES
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+            self._log_line_count = MAX_LOG_LINES
+        if at_bottom:
+            self.log_text.see(tk.END)
+
+    def _show_fraction(self, fraction: float):
+        """Switch the progress bar to a determinate fill of fraction (0..1)."""
+        if str(self.progress_bar.cget("mode")) != "determinate":
+            self.progress_bar.stop()
+            self.progress_bar.config(mode="determinate")
+        self.progress_var.set(fraction * 100)
+
+    @staticmethod
+    def _block_log_edit(event):
+        """Let keys through that copy or navigate the log; swallow the rest."""
+        if event.keysym in LOG_NAVIGATION_KEYS:
+            return None
+        if event.state & 0x4 and event.keysym.lower() in ("c", "a"):
+            return None
+        return "break"
 
     # ────────────────────────────────────────────────────────────────────────────
     # UPDATE MANAGEMENT (silent/manual checks)
@@ -446,12 +740,26 @@ class VeetechDesktopApp:
 
     def check_updates_silent(self):
         """Check for updates silently on startup."""
-        def check_thread():
-            update_info = self.update_manager.check_for_updates()
+        # A recent check is answered from the cache without a background job
+        cached = self.update_manager.cached_update_info()
+        if cached is not None:
+            if cached.get("update_available"):
+                self._ui_queue.put(lambda: self.show_update_notification(cached))
+            return
+
+        started = time.monotonic()
+
+        def check_done(future):
+            update_info = future.result()
+            # Retries on a flaky network can outlast the request timeouts; a late
+            # answer is skipped rather than popping up in the middle of work
+            if time.monotonic() - started > SILENT_CHECK_DEADLINE:
+                return
             if not update_info.get("error") and update_info.get("update_available"):
-                self.root.after(0, lambda: self.show_update_notification(update_info))
+                self._ui_queue.put(lambda: self.show_update_notification(update_info))
 
-        threading.Thread(target=check_thread, daemon=True).start()
+        # Shares a check already running, e.g. one started from the Help menu
+        self.update_manager.check_in_background().add_done_callback(check_done)
 
     def check_updates_manual(self):
         """Manual “Check for Updates…” menu action."""
@@ -459,6 +767,8 @@ class VeetechDesktopApp:
 
     def show_update_notification(self, update_info: dict):
         """Show update notification popup."""
+        # Download while the user reads the prompt; "Yes" then finds the bytes on disk
+        self.update_manager.prefetch_update(update_info["download_url"])
         result = messagebox.askyesno(
             "Update Available",
             f"A new version ({update_info['latest_version']}) is available!\n\n"
@@ -467,27 +777,32 @@ class VeetechDesktopApp:
             "Would you like to download and install the update?"
         )
         if result:
-            self.download_and_install_update(update_info["download_url"])
+            self.download_and_install_update(update_info)
+        else:
+            self.update_manager.discard_prefetch(update_info["download_url"])
 
-    def download_and_install_update(self, download_url: str):
-        """Download and install update."""
+    def download_and_install_update(self, update_info: dict):
+        """Download, verify and install update."""
         def download_thread():
             try:
                 update_file = self.update_manager.download_update(
-                    download_url,
-                    progress_callback=self.update_download_progress
+                    update_info["download_url"],
+                    progress_callback=self.update_download_progress,
+                    sha256=self.update_manager.expected_sha256(update_info)
                 )
                 success = self.update_manager.apply_update(update_file)
-                self.root.after(0, lambda: self.update_download_complete(success))
+                self._ui_queue.put(lambda: self.update_download_complete(success))
             except Exception as e:
                 error_msg = f"Update failed: {str(e)}"
-                self.root.after(0, lambda: self.update_download_error(error_msg))
+                self._ui_queue.put(lambda: self.update_download_error(error_msg))
 
         self.log_message("Starting update download...")
-        threading.Thread(target=download_thread, daemon=True).start()
+        # Resume from wherever the prefetch got to, with progress shown
+        self.update_manager.stop_prefetch()
+        self.update_manager.submit(download_thread)
 
     def update_download_progress(self, message: str):
-        self.root.after(0, lambda: self.log_message(message))
+        self.log_message(message)
 
     def update_download_complete(self, success: bool):
         if success:
@@ -544,6 +859,13 @@ Features:
             self.logger.error(f"Application error: {e}")
             self.logger.error(traceback.format_exc())
         finally:
+            # A live pipeline process would otherwise keep the app from exiting;
+            # give it a moment to stop and clean up on its own first
+            self._cancel_timer = None  # the Tk root is gone, so nothing to unschedule
+            if self.processing_process is not None:
+                self._cancel_event.set()
+                self.processing_process.join(EXIT_CANCEL_GRACE)
+            self._finish_process(terminate=True)
             self.logger.info("Application shutting down")
 
     def center_window(self):
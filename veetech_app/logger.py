@@ -1,6 +1,7 @@
 # veetech_app/logger.py
 
 import logging
+import logging.handlers
 from .config import AppConfig
 
 class AppLogger:
@@ -28,11 +29,18 @@ class AppLogger:
         console_handler.setFormatter(logging.Formatter(log_format, date_format))
         logger.addHandler(console_handler)
 
-        # File handler (if enabled)
+        # File handler (if enabled), buffered so processing loops don't hit
+        # the disk on every record; errors flush the buffer immediately
         if self.config.save_logs:
             file_handler = logging.FileHandler(self.config.log_file)
             file_handler.setFormatter(logging.Formatter(log_format, date_format))
-            logger.addHandler(file_handler)
+            buffered_handler = logging.handlers.MemoryHandler(
+                capacity=1024,
+                flushLevel=logging.ERROR,
+                target=file_handler
+            )
+            # logging.shutdown closes this before file_handler at exit, flushing it
+            logger.addHandler(buffered_handler)
 
     @staticmethod
     def get_logger(name: str = __name__) -> logging.Logger:
@@ -2,14 +2,15 @@
 
 import logging
 import traceback
-import tempfile
-import shutil
 import os
 from tkinter import messagebox
 import tkinter as tk  # only needed if error happens before Tk is created
 from .gui import VeetechDesktopApp
 from .logger import AppLogger
 
+CLEANUP_WORKERS = 8    # threads removing leftover temp dirs at exit
+CLEANUP_TIMEOUT = 5.0  # seconds to wait for that cleanup before exiting
+
 def main():
     """Application entry point."""
     try:
@@ -29,18 +30,41 @@ def main():
             print(f"Critical error: {e}")
 
     finally:
-        # Cleanup any leftover temp dirs
+        # Cleanup any leftover temp dirs; only needed here, so imported here
+        import shutil
+        import tempfile
+        import threading
+        import time
         temp_dir = tempfile.gettempdir()
-        for item in os.listdir(temp_dir):
-            if item.startswith("veetech_"):
-                item_path = os.path.join(temp_dir, item)
+        # scandir entries carry their type, so only matching names cost a syscall
+        dirs = []
+        with os.scandir(temp_dir) as it:
+            for entry in it:
+                if not entry.name.startswith("veetech_"):
+                    continue
                 try:
-                    if os.path.isdir(item_path):
-                        shutil.rmtree(item_path)
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
                     else:
-                        os.remove(item_path)
-                except:
+                        os.remove(entry.path)
+                except OSError:
                     pass
+        if dirs:
+            # rmtree is syscall-bound, so a few threads overlap the waits. They
+            # are daemon threads: joining with a deadline really bounds exit, and
+            # whatever is unfinished is left for the next run's sweep.
+            def remove_all(paths):
+                for path in paths:
+                    shutil.rmtree(path, ignore_errors=True)
+
+            workers = [threading.Thread(target=remove_all, args=(dirs[i::CLEANUP_WORKERS],),
+                                        daemon=True)
+                       for i in range(min(CLEANUP_WORKERS, len(dirs)))]
+            for worker in workers:
+                worker.start()
+            deadline = time.monotonic() + CLEANUP_TIMEOUT
+            for worker in workers:
+                worker.join(max(0.0, deadline - time.monotonic()))
 
 if __name__ == "__main__":
     main()
@@ -1,11 +1,11 @@
 # veetech_app/metadata_extractor.py
 
 import re
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from .ocr_processor import OCRProcessor
 from .date_formatter import DateFormatter
-from .config import AppConfig
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 
 class PatternConfig:
@@ -37,8 +37,46 @@ class PatternConfig:
         "TEST CERTIFICA'": "TestCertificate",
         "CERTIFICATE OF CALIBRATION": "CalibrationCertificate"
     }
+    # Uppercased once so lookups never depend on how the map keys are written
+    _CERT_TYPE_LUT = {k.upper(): v for k, v in CERTIFICATE_TYPE_MAP.items()}
 
-@dataclass
+    # (field key, extract_field name, patterns) scanned together by extract_all_metadata
+    COMBINED_FIELDS = (
+        ("tag", "Tag Number", TAG_PATTERNS),
+        ("serial", "Serial Number", SERIAL_PATTERNS),
+        ("unit", "Unit ID", UNIT_PATTERNS),
+        ("issue", "Issue Date", ISSUE_PATTERNS),
+        ("cert", "Certificate Type", CERTIFICATE_PATTERNS),
+    )
+
+    @classmethod
+    def build_combined_re(cls) -> "re.Pattern":
+        """
+        Join every field pattern into one alternation of zero-width lookaheads.
+        Each alternative is named "<field>_<index>" and its value group
+        "<field>_<index>_val". Lookaheads keep one field's match from consuming
+        text another field needs; each field starts with its own literal label,
+        so at most one alternative can match at any position.
+        """
+        alternatives = []
+        lead_chars = set()
+        for key, _, patterns in cls.COMBINED_FIELDS:
+            for idx, pattern in enumerate(patterns):
+                name = f"{key}_{idx}"
+                body = re.sub(r"(?<!\\)\((?!\?)", f"(?P<{name}_val>", pattern, count=1)
+                alternatives.append(f"(?=(?P<{name}>{body}))")
+                # Patterns start with a label or a group of literal alternatives
+                heads = pattern[1:].split("|") if pattern.startswith("(") else [pattern]
+                lead_chars.update(head[:1].lower() for head in heads)
+        combined = "|".join(alternatives)
+        # A leading character class lets the engine skip ahead to candidate
+        # positions instead of trying every alternative at every offset.
+        if all(ch.isalnum() for ch in lead_chars):
+            combined = f"(?=[{''.join(sorted(lead_chars))}])(?:{combined})"
+        return re.compile(combined, re.IGNORECASE)
+
+# Built once per certificate and only read field by field; never compared
+@dataclass(slots=True, eq=False)
 class CertificateMetadata:
     """Container for extracted certificate metadata."""
     issue_date: str
@@ -47,43 +85,174 @@ class CertificateMetadata:
     unit_id: Optional[str] = None
     certificate_type: str = ""
 
+def _uppercase_pattern(pattern: str) -> str:
+    """
+    Uppercase a pattern's literals so it can run case-sensitively over
+    uppercased text. Escapes (\\d, \\s, ...) and group names are left as is.
+    """
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern[i] == "\\":
+            out.append(pattern[i:i + 2])
+            i += 2
+        elif pattern.startswith("(?P<", i):
+            end = pattern.index(">", i) + 1
+            out.append(pattern[i:end])
+            i = end
+        else:
+            out.append(pattern[i].upper())
+            i += 1
+    return "".join(out)
+
+_COMBINED_RE = PatternConfig.build_combined_re()
+# Case folding per character makes IGNORECASE matching slower than matching
+# uppercase patterns against text uppercased once
+_COMBINED_UPPER_RE = re.compile(_uppercase_pattern(_COMBINED_RE.pattern))
+# Letters, an optional misread "O" (lazy letters let it claim the O first), digits
+_TAG_LETTERS_DIGITS_RE = re.compile(r"^([A-Za-z]{2,5}?)(O?)(\d+)$")
+_ALL_DATES_RE = re.compile(r"\d{2}/\d{2}/\d{4}")
+
+@lru_cache(maxsize=None)
+def _compile_patterns(patterns: Tuple[str, ...],
+                      upper: bool = False) -> Tuple["re.Pattern", Tuple["re.Pattern", ...]]:
+    """
+    Compile a pattern list once into a union of named alternatives "p<index>",
+    plus each pattern on its own. With upper, patterns are uppercased and
+    compiled case-sensitively for use on uppercased text.
+    PatternConfig lists never change at runtime.
+    """
+    if upper:
+        patterns = tuple(_uppercase_pattern(pattern) for pattern in patterns)
+        flags = 0
+    else:
+        flags = re.IGNORECASE
+    union = "|".join(f"(?P<p{idx}>{pattern})" for idx, pattern in enumerate(patterns))
+    compiled = tuple(re.compile(pattern, flags) for pattern in patterns)
+    return re.compile(union, flags), compiled
+
+def _uppercase_text(text: str) -> Optional[str]:
+    """
+    Uppercase text, or None unless it is ASCII. IGNORECASE also equates some
+    non-ASCII letters with ASCII ones ("İ", "ı", "ſ", the Kelvin sign) that
+    uppercasing does not map onto them, so only ASCII text matches the same.
+    """
+    return text.upper() if text.isascii() else None
+
 class MetadataExtractor:
     """Extracts metadata fields from certificate text."""
 
     @staticmethod
     def extract_field(patterns: List[str], text: str, field_name: str) -> Optional[str]:
         """Search text using regex patterns and return first match."""
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                value = match.group(1).strip()
-                if field_name.lower() == "tag number":
-                    value = MetadataExtractor._process_tag_value(value)
-                if value.upper() in ("N/A", "NA"):
-                    return None
-                return value
-        return None
+        # Match on uppercased text where offsets line up, but slice values
+        # from the original so their casing is kept
+        upper = _uppercase_text(text)
+        subject = text if upper is None else upper
+        union, compiled = _compile_patterns(tuple(patterns), upper is not None)
+        match = union.search(subject)
+        if not match:
+            return None
+        idx = int(match.lastgroup[1:])
+        # Earlier patterns take priority even when a later one matches first.
+        # None of them matched at or before this position, so only look beyond it.
+        for pattern in compiled[:idx]:
+            earlier = pattern.search(subject, match.start() + 1)
+            if earlier:
+                return MetadataExtractor._clean_value(text[earlier.start(1):earlier.end(1)],
+                                                      field_name)
+        # The pattern's own first group follows its named wrapper group
+        group = union.groupindex[match.lastgroup] + 1
+        return MetadataExtractor._clean_value(text[match.start(group):match.end(group)],
+                                              field_name)
+
+    @staticmethod
+    def _clean_value(value: str, field_name: str) -> Optional[str]:
+        """Strip a captured value, fix up tags and map N/A to None."""
+        value = value.strip()
+        if field_name.lower() == "tag number":
+            value = MetadataExtractor._process_tag_value(value)
+        if value.upper() in ("N/A", "NA"):
+            return None
+        return value
+
+    @staticmethod
+    def _best_matches(text: str) -> Dict[str, Tuple[int, int, int]]:
+        """
+        Find every combined field in one pass over text, as
+        {key: (pattern index, value start, value end)}.
+        Mirrors extract_field: the earliest pattern in each list wins, using
+        that pattern's leftmost match.
+        """
+        best: Dict[str, Tuple[int, int, int]] = {}
+        upper = _uppercase_text(text)
+        if upper is None:
+            matches = _COMBINED_RE.finditer(text)
+        else:
+            matches = _COMBINED_UPPER_RE.finditer(upper)
+        for match in matches:
+            name = match.lastgroup
+            key, idx = name.rsplit("_", 1)
+            idx = int(idx)
+            if key not in best or idx < best[key][0]:
+                start, end = match.span(f"{name}_val")
+                best[key] = (idx, start, end)
+                if len(best) == len(PatternConfig.COMBINED_FIELDS) and \
+                        all(found[0] == 0 for found in best.values()):
+                    break
+        return best
+
+    @staticmethod
+    def _scan_fields(text: str) -> Dict[str, Optional[str]]:
+        """Find every combined field in one pass over text and clean the values."""
+        best = MetadataExtractor._best_matches(text)
+        values: Dict[str, Optional[str]] = {}
+        for key, field_name, _ in PatternConfig.COMBINED_FIELDS:
+            found = best.get(key)
+            values[key] = (MetadataExtractor._clean_value(text[found[1]:found[2]], field_name)
+                           if found else None)
+        return values
+
+    @staticmethod
+    def can_extract_all(text: str) -> bool:
+        """
+        True once more text appended to text cannot change extract_all_metadata:
+        every field has a match from its first-priority pattern that ends before
+        the end of text, and the issue date is valid (so no fallback is needed).
+        """
+        best = MetadataExtractor._best_matches(text)
+        if len(best) < len(PatternConfig.COMBINED_FIELDS):
+            return False
+        if any(idx != 0 or end >= len(text) for idx, _, end in best.values()):
+            return False
+        _, start, end = best["issue"]
+        return DateFormatter.format_date(text[start:end]) is not None
 
     @staticmethod
     def _process_tag_value(value: str) -> str:
         """Process and correct tag number values."""
         value = OCRProcessor.correct_ocr_errors(value)
-        # If O vs 0 confusion
-        if match := re.match(r"^([A-Za-z]{2,5})O(\d+)$", value):
-            return f"{match[1]}-0{match[2]}"
-        # If no hyphen but alphanumeric
-        if "-" not in value and re.match(r"^[A-Za-z]{2,5}\d+$", value):
-            letters, numbers = re.match(r"^([A-Za-z]{2,5})(\d+)$", value).groups()
-            return f"{letters}-{numbers}"
+        # Already hyphenated tags are left alone
+        if "-" in value:
+            return value
+        # Letters and digits with no hyphen, fixing an "O" misread for "0"
+        if match := _TAG_LETTERS_DIGITS_RE.match(value):
+            letters, o, numbers = match.groups()
+            return f"{letters}-{'0' if o else ''}{numbers}"
         return value
 
     @staticmethod
     def extract_issue_date(text: str) -> str:
         """Extract and format issue date."""
         raw_date = MetadataExtractor.extract_field(PatternConfig.ISSUE_PATTERNS, text, "Issue Date")
+        return MetadataExtractor._format_issue_date(raw_date, text)
+
+    @staticmethod
+    def _format_issue_date(raw_date: Optional[str], text: str) -> str:
+        """Format a captured issue date, falling back to the fifth date in text."""
         issue_date = DateFormatter.format_date(raw_date)
         if not issue_date:
-            all_dates = re.findall(r"\d{2}/\d{2}/\d{4}", text)
+            all_dates = _ALL_DATES_RE.findall(text)
             if len(all_dates) >= 5:
                 issue_date = DateFormatter.format_date(all_dates[4])
         if not issue_date:
@@ -95,20 +264,27 @@ class MetadataExtractor:
         """Extract and normalize certificate type."""
         raw_type = MetadataExtractor.extract_field(PatternConfig.CERTIFICATE_PATTERNS,
                                                   text, "Certificate Type")
+        return MetadataExtractor._normalize_certificate_type(raw_type)
+
+    @staticmethod
+    def _normalize_certificate_type(raw_type: Optional[str]) -> str:
+        """Map a captured certificate type onto its filename form."""
         if not raw_type:
             raise ValueError("Certificate type not found")
-        normalized = PatternConfig.CERTIFICATE_TYPE_MAP.get(
-            raw_type.upper(), raw_type.title().replace(" ", "")
-        )
+        normalized = PatternConfig._CERT_TYPE_LUT.get(raw_type.upper())
+        if normalized is None:
+            # Only build the title-cased fallback on a miss
+            normalized = raw_type.title().replace(" ", "")
         return normalized
 
     @classmethod
     def extract_all_metadata(cls, text: str) -> CertificateMetadata:
         """Extract all metadata from certificate text."""
+        fields = cls._scan_fields(text)
         return CertificateMetadata(
-            issue_date=cls.extract_issue_date(text),
-            tag=cls.extract_field(PatternConfig.TAG_PATTERNS, text, "Tag Number"),
-            serial=cls.extract_field(PatternConfig.SERIAL_PATTERNS, text, "Serial Number"),
-            unit_id=cls.extract_field(PatternConfig.UNIT_PATTERNS, text, "Unit ID"),
-            certificate_type=cls.extract_certificate_type(text),
+            issue_date=cls._format_issue_date(fields["issue"], text),
+            tag=fields["tag"],
+            serial=fields["serial"],
+            unit_id=fields["unit"],
+            certificate_type=cls._normalize_certificate_type(fields["cert"]),
         )
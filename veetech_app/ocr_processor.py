@@ -1,7 +1,6 @@
 # veetech_app/ocr_processor.py
 
 import re
-import ocrmypdf
 import os, shutil, sys
 
 
@@ -27,59 +26,101 @@ if platform.system() == "Windows":
 class OCRProcessor:
     """Handles OCR operations and text correction."""
 
+    # Fix-ups run as separate passes, in this order: their matches can overlap
+    # (a tag running into "TEST CERTTFICATE", a fixed "KT00" inside a dashed
+    # tag) or one pass can create a match for the next (the title fix adds a
+    # space the dash fix's \b then matches), so fusing passes changes the text.
+    _KT_RE = re.compile(r"KTOO(\d+)", re.IGNORECASE)
+    _DASH_RE = re.compile(r"(\b[A-Za-z0-9]+)-([A-Za-z0-9]+)-5-([A-Za-z0-9]+)-([A-Za-z0-9]+\b)",
+                          re.IGNORECASE)
+    _TC_RE = re.compile(r"TEST\s*CERTTFICATE", re.IGNORECASE)
+    _COC_RE = re.compile(r"CERTIFICATE[\s\r\n]+OF[\s\r\n]+(CALIBRATION|TEST|INSPECTION)",
+                         re.IGNORECASE)
+    _TAG_RE = re.compile(r"\b[A-Z]{2,5}(?:[-/][A-Za-z0-9]{1,10})+\b")
+    _TAG_SPLIT_RE = re.compile(r"([-\/])")
+    _O_TO_ZERO = str.maketrans("O", "0")
+
     @staticmethod
-    def perform_ocr(input_path: str, output_path: str, progress_callback=None) -> None:
-        """Run OCR on input PDF and save searchable PDF to output path."""
+    def perform_ocr(input_path: str, output_path: str, progress_callback=None,
+                    fast_mode: bool = False) -> None:
+        """
+        Run OCR on input PDF and save searchable PDF to output path.
+        By default every page is rasterized and re-OCR'd with deskew; with
+        fast_mode, a PDF that already has a text layer only has pages lacking
+        good text redone.
+        """
+        # Imported here: extraction workers import this module for the text
+        # fix-ups only, and should not pay for loading ocrmypdf
+        import ocrmypdf
         if progress_callback:
             progress_callback("Starting OCR processing...")
+        # ocrmypdf already runs one Tesseract per page in parallel; letting each
+        # Tesseract spawn its own OpenMP threads on top oversubscribes the CPU.
+        os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+        if fast_mode and OCRProcessor._has_text_layer(input_path):
+            # Only re-OCR what lacks good text instead of rasterizing every page;
+            # ocrmypdf does not support deskew together with redo_ocr
+            mode = {"redo_ocr": True}
+        else:
+            mode = {"force_ocr": True, "deskew": True}
         ocrmypdf.ocr(
             input_file=input_path,
             output_file=output_path,
-            force_ocr=True,
             use_threads=True,
+            jobs=max(1, (os.cpu_count() or 1) // 2),
             skip_text=False,
-            deskew=True,
             language="eng",
+            # The OCR'd file is only an intermediate for splitting, so skip the
+            # Ghostscript PDF/A conversion and image optimization ocrmypdf runs by default
+            output_type="pdf",
+            optimize=0,
+            **mode,
         )
         if progress_callback:
             progress_callback("OCR processing complete")
 
+    @staticmethod
+    def _has_text_layer(pdf_path: str) -> bool:
+        """Return True if any page of the PDF already carries text."""
+        import fitz  # PyMuPDF
+        with fitz.open(pdf_path) as doc:
+            return any(page.get_text().strip() for page in doc)
+
     @staticmethod
     def correct_ocr_errors(text: str) -> str:
         """Apply regex fixes for common OCR misreads."""
-        corrections = [
-            (r"KTOO(\d+)", r"KT00\1"),
-            (r"(\b[A-Za-z0-9]+)-([A-Za-z0-9]+)-5-([A-Za-z0-9]+)-([A-Za-z0-9]+\b)",
-             r"\1-\2-S-\3-\4"),
-            (r"TEST\s*CERTTFICATE", "TEST CERTIFICATE"),
-        ]
-        for pattern, replacement in corrections:
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-
-        multiline_fixes = {
-            r"CERTIFICATE[\s\r\n]+OF[\s\r\n]+CALIBRATION": "CERTIFICATE OF CALIBRATION",
-            r"CERTIFICATE[\s\r\n]+OF[\s\r\n]+TEST": "CERTIFICATE OF TEST",
-            r"CERTIFICATE[\s\r\n]+OF[\s\r\n]+INSPECTION": "CERTIFICATE OF INSPECTION",
-        }
-        for pattern, replacement in multiline_fixes.items():
-            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-
+        # Each pass needs a literal that is far cheaper to test for than running
+        # the pass. casefold maps every letter IGNORECASE treats as equal onto
+        # the same lowercase letter, except for "i" (dotted/dotless I), so the
+        # tested literals avoid "i".
+        folded = text.casefold()
+        if "ktoo" in folded:
+            text = OCRProcessor._KT_RE.sub(r"KT00\1", text)
+        if "-5-" in text:
+            text = OCRProcessor._DASH_RE.sub(r"\1-\2-S-\3-\4", text)
+        if "certtf" in folded:
+            text = OCRProcessor._TC_RE.sub("TEST CERTIFICATE", text)
+        if "cert" in folded:
+            text = OCRProcessor._COC_RE.sub(OCRProcessor._certificate_of, text)
         # Fix tag‐format (O vs 0, etc.)
-        text = re.sub(r"\b[A-Z]{2,5}(?:[-/][A-Za-z0-9]{1,10})+\b",
-                      OCRProcessor._fix_tag_format, text)
+        if "-" in text or "/" in text:
+            text = OCRProcessor._TAG_RE.sub(OCRProcessor._fix_tag_format, text)
         return text
 
+    @staticmethod
+    def _certificate_of(match: re.Match) -> str:
+        """Collapse a "CERTIFICATE OF <kind>" title broken over lines or spaces."""
+        return f"CERTIFICATE OF {match[1].upper()}"
+
     @staticmethod
     def _fix_tag_format(match: re.Match) -> str:
         """Fix O/0 confusion in tag numbers."""
         tag = match.group(0)
-        parts = re.split(r"([-\/])", tag)
-        rebuilt = []
-        for part in parts:
-            if part in "-/":
-                rebuilt.append(part)
-            elif any(ch.isdigit() for ch in part) and "O" in part:
-                rebuilt.append(part.replace("O", "0"))
-            else:
-                rebuilt.append(part)
-        return "".join(rebuilt)
+        if "O" not in tag:
+            # Nothing to fix; skip splitting and rebuilding the tag
+            return tag
+        # Only parts that contain a digit are numeric fields misread with "O"
+        return "".join(
+            part.translate(OCRProcessor._O_TO_ZERO) if any(map(str.isdigit, part)) else part
+            for part in OCRProcessor._TAG_SPLIT_RE.split(tag)
+        )
@@ -2,10 +2,28 @@
 
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Tuple
 import fitz  # PyMuPDF
-from PyPDF2 import PdfReader, PdfWriter
+
+MARKER_TEXT = "Recommended Due Date"
+_MARKER_RE = re.compile(MARKER_TEXT, re.IGNORECASE)
+# Below this many chunks, starting worker processes costs more than it saves
+PARALLEL_SPLIT_MIN_CHUNKS = 8
+
+# Source document opened once per worker process by _init_split_worker
+_worker_doc = None
+
+def _init_split_worker(pdf_path: str) -> None:
+    """Open the source PDF in a split worker process."""
+    global _worker_doc
+    _worker_doc = fitz.open(pdf_path)
+
+def _write_chunk_in_worker(start: int, end: int, output_dir: str,
+                           base_name: str, chunk_idx: int) -> str:
+    """Write one chunk from the worker's copy of the source PDF."""
+    return PDFSplitter._create_chunk(_worker_doc, start, end, output_dir, base_name, chunk_idx)
 
 class PDFSplitter:
     """Handles PDF splitting operations."""
@@ -15,7 +33,6 @@ class PDFSplitter:
                                      progress_callback=None) -> List[Tuple[str,int,int]]:
         """Split PDF into certificate chunks based on 'Recommended Due Date' markers."""
         fitz_doc = fitz.open(pdf_path)
-        reader = PdfReader(pdf_path)
         total_pages = len(fitz_doc)
         base_name = Path(pdf_path).stem
 
@@ -28,24 +45,62 @@ class PDFSplitter:
             if progress_callback:
                 progress_callback(f"Found {len(start_pages)} certificates, splitting...")
 
-            chunks = []
-            for idx, start in enumerate(start_pages, start=1):
-                end = start_pages[idx] if idx < len(start_pages) else total_pages
-                chunk_path = PDFSplitter._create_chunk(reader, start, end, output_dir, base_name, idx)
-                chunks.append((chunk_path, start, end))
-                if progress_callback:
-                    progress_callback(f"Created certificate chunk {idx}/{len(start_pages)}")
-            return chunks
+            ranges = [
+                (start, start_pages[idx] if idx < len(start_pages) else total_pages, idx)
+                for idx, start in enumerate(start_pages, start=1)
+            ]
+            if len(ranges) < PARALLEL_SPLIT_MIN_CHUNKS:
+                chunks = []
+                for start, end, idx in ranges:
+                    chunk_path = PDFSplitter._create_chunk(fitz_doc, start, end, output_dir, base_name, idx)
+                    chunks.append((chunk_path, start, end))
+                    if progress_callback:
+                        progress_callback(f"Created certificate chunk {idx}/{len(ranges)}")
+                return chunks
         finally:
             fitz_doc.close()
 
+        return PDFSplitter._create_chunks_parallel(pdf_path, ranges, output_dir,
+                                                   base_name, progress_callback)
+
+    @staticmethod
+    def _create_chunks_parallel(pdf_path: str, ranges: List[Tuple[int, int, int]],
+                                output_dir: str, base_name: str,
+                                progress_callback=None) -> List[Tuple[str, int, int]]:
+        """Write chunks across worker processes, each with its own open copy of the PDF."""
+        workers = max(1, min(len(ranges), (os.cpu_count() or 2) - 1))
+        paths = {}
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_split_worker,
+                                 initargs=(pdf_path,)) as pool:
+            futures = {
+                pool.submit(_write_chunk_in_worker, start, end, output_dir, base_name, idx): idx
+                for start, end, idx in ranges
+            }
+            try:
+                for done, future in enumerate(as_completed(futures), start=1):
+                    paths[futures[future]] = future.result()
+                    if progress_callback:
+                        progress_callback(f"Created certificate chunk {done}/{len(ranges)}")
+            except BaseException:
+                # On a cancel or a failed write, leaving the block only waits
+                # for the writes already running, not every queued chunk
+                for future in futures:
+                    future.cancel()
+                raise
+        # Chunks are returned in page order regardless of completion order
+        return [(paths[idx], start, end) for start, end, idx in ranges]
+
     @staticmethod
     def _find_certificate_start_pages(fitz_doc, total_pages: int) -> List[int]:
         """Find pages that start new certificates."""
-        start_pages = [
-            i for i in range(total_pages)
-            if re.search(r"Recommended Due Date", fitz_doc[i].get_text(), re.IGNORECASE)
-        ]
+        # MuPDF's native (case-insensitive) search avoids building each page's text in Python
+        start_pages = [i for i in range(total_pages) if fitz_doc[i].search_for(MARKER_TEXT)]
+        if not start_pages:
+            # search_for can miss markers in some OCR text layers; fall back to the text scan
+            start_pages = [
+                i for i in range(total_pages)
+                if _MARKER_RE.search(fitz_doc[i].get_text())
+            ]
         if not start_pages:
             start_pages = [0]
         if start_pages[0] != 0:
@@ -53,13 +108,19 @@ class PDFSplitter:
         return start_pages
 
     @staticmethod
-    def _create_chunk(reader: PdfReader, start: int, end: int,
+    def _create_chunk(fitz_doc, start: int, end: int,
                       output_dir: str, base_name: str, chunk_idx: int) -> str:
         """Create a PDF chunk from page range."""
-        writer = PdfWriter()
-        for page_num in range(start, end):
-            writer.add_page(reader.pages[page_num])
+        # insert_pdf copies the page objects at the C level; the source streams
+        # are already compressed, so skip garbage collection and re-deflating
+        chunk_doc = fitz.open()
+        try:
+            chunk_doc.insert_pdf(fitz_doc, from_page=start, to_page=end - 1)
+            # Serialize in memory and write the file in one go rather than
+            # letting the PDF writer issue many small writes
+            data = chunk_doc.tobytes(garbage=0, deflate=False)
+        finally:
+            chunk_doc.close()
         chunk_path = os.path.join(output_dir, f"{base_name}_cert_{chunk_idx}.pdf")
-        with open(chunk_path, "wb") as f:
-            writer.write(f)
+        Path(chunk_path).write_bytes(data)
         return chunk_path
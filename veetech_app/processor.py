@@ -1,11 +1,15 @@
 # veetech_app/processor.py
 
+import errno
 import os
 import shutil
 import tempfile
+import time
 import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Tuple, Set
+from typing import List, Optional, Tuple, Set
 from .ocr_processor import OCRProcessor
 from .text_extractor import TextExtractor
 from .metadata_extractor import MetadataExtractor, CertificateMetadata
@@ -16,6 +20,8 @@ from .logger import AppLogger
 from dataclasses import dataclass
 from typing import List, Tuple, Any
 
+PARALLEL_EXTRACT_MIN_CHUNKS = 8  # below this, worker start-up costs more than it saves
+
 @dataclass
 class ProcessingResult:
     """Container for processing results."""
@@ -25,43 +31,140 @@ class ProcessingResult:
     errors: List[Tuple[str, int, int, str]]
     output_directory: str = ""
 
+class ProcessingCancelled(Exception):
+    """Raised inside the pipeline once its cancel event is set."""
+
+def _extract_chunk_metadata(chunk_path: str):
+    """Extract metadata from a single chunk; runs in a worker process.
+
+    Exceptions are returned rather than raised so one bad chunk does not
+    abort the remaining results.
+    """
+    try:
+        # Certificate fields sit near the start, so later pages are usually skipped
+        text = TextExtractor.extract_text_from_pdf(chunk_path,
+                                                   stop_when=MetadataExtractor.can_extract_all)
+        return MetadataExtractor.extract_all_metadata(text)
+    except Exception as e:
+        return e
+
+def _iter_chunk_metadata(chunk_paths: List[str]):
+    """
+    Yield _extract_chunk_metadata's outcome for each chunk, in chunk order.
+    Never raises for a single chunk: failures, including a crashed worker
+    process, come back as exceptions for that chunk only.
+    """
+    total = len(chunk_paths)
+    if total < PARALLEL_EXTRACT_MIN_CHUNKS:
+        for chunk_path in chunk_paths:
+            yield _extract_chunk_metadata(chunk_path)
+        return
+
+    # Extraction is CPU-bound Python, so fan it out across processes
+    workers = max(1, min(total, os.cpu_count() or 1))
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [pool.submit(_extract_chunk_metadata, path) for path in chunk_paths]
+        for i, chunk_path in enumerate(chunk_paths):
+            try:
+                outcome = futures[i].result()
+            except BrokenProcessPool:
+                # A worker died (e.g. crashed on a bad chunk) and every pending
+                # future went with it. Retry this chunk alone so only the chunk
+                # that crashes fails, then resubmit the rest to a fresh pool.
+                pool.shutdown(wait=False, cancel_futures=True)
+                with ProcessPoolExecutor(max_workers=1) as retry_pool:
+                    try:
+                        outcome = retry_pool.submit(_extract_chunk_metadata, chunk_path).result()
+                    except BrokenProcessPool as e:
+                        outcome = e
+                pool = ProcessPoolExecutor(max_workers=workers)
+                futures[i + 1:] = [pool.submit(_extract_chunk_metadata, path)
+                                   for path in chunk_paths[i + 1:]]
+            yield outcome
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
 class VeetechProcessor:
     """Main processing pipeline coordinator."""
 
-    def __init__(self, input_file: str, progress_callback=None):
+    def __init__(self, input_file: str, progress_callback=None,
+                 clean_output_dir: bool = False, fast_mode: bool = False,
+                 cancel_event=None):
         self.input_file = input_file
+        self.clean_output_dir = clean_output_dir
+        # Passed to OCRProcessor.perform_ocr; off means force OCR on every page
+        self.fast_mode = fast_mode
         self.base_name = Path(input_file).stem
         self.progress_callback = progress_callback
+        # Anything with is_set() (threading/multiprocessing Event); checked
+        # between stages and chunks, never in the middle of one
+        self.cancel_event = cancel_event
         self.logger = AppLogger.get_logger(__name__)
+        self._log_info = self.logger.info
+        self._log_error = self.logger.error
 
         # Setup paths
         self.ocr_output = str(Path(input_file).parent / f"{self.base_name}_OCR.pdf")
-        self.split_dir = tempfile.mkdtemp(prefix="veetech_split_")
+        self.split_dir = tempfile.mkdtemp(prefix="veetech_split_",
+                                          dir=self._split_parent(input_file))
+        self._split_dir_created = True
+        # Set once OCR starts, so cleanup only touches files this run may have written
+        self._ocr_output_created = False
         self.output_dir = str(Path(input_file).parent / f"{self.base_name}_processed")
+        self._output_dir_path = Path(self.output_dir)
 
-        # Prepare output directory
-        if Path(self.output_dir).exists():
-            shutil.rmtree(self.output_dir)
-        Path(self.output_dir).mkdir(exist_ok=True)
+    @staticmethod
+    def _split_parent(input_file: str) -> str:
+        """
+        Directory to create the split dir in: the temp root, where the exit
+        sweep in main finds leftovers, unless it is on another volume than the
+        output. Then the input's folder is used, so moves stay renames.
+        """
+        temp_root = tempfile.gettempdir()
+        input_parent = os.path.dirname(os.path.abspath(input_file))
+        try:
+            if os.stat(temp_root).st_dev == os.stat(input_parent).st_dev:
+                return temp_root
+        except OSError:
+            return temp_root
+        return input_parent
 
     def process(self) -> ProcessingResult:
         """Execute the complete processing pipeline."""
         try:
-            # Step 1: OCR
+            # Step 1: OCR. A bad output path fails here rather than after the
+            # whole OCR pass; only clearing earlier output, which cannot fail,
+            # runs alongside it (ocrmypdf works in subprocesses)
+            self._check_cancelled()
+            self._prepare_output_dir()
             self._update_progress("Starting OCR processing...")
-            OCRProcessor.perform_ocr(self.input_file, self.ocr_output, self.progress_callback)
+            self._ocr_output_created = True
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                ocr_future = pool.submit(OCRProcessor.perform_ocr, self.input_file,
+                                         self.ocr_output, self._report_stage,
+                                         self.fast_mode)
+                clear_future = (pool.submit(self._clear_output_dir)
+                                if self.clean_output_dir else None)
+                ocr_future.result()
+                if clear_future is not None:
+                    clear_future.result()
 
             # Step 2: Split PDF
+            self._check_cancelled()
             self._update_progress("Splitting PDF into certificates...")
             chunks = PDFSplitter.split_by_certificate_markers(
-                self.ocr_output, self.split_dir, self.progress_callback
+                self.ocr_output, self.split_dir, self._report_stage
             )
 
             # Step 3: Process chunks
+            self._check_cancelled()
             self._update_progress("Processing certificate chunks...")
             result = self._process_chunks_step(chunks)
 
-            # Step 4: Organize files
+            # Step 4: Organize files (not interrupted once started, so a
+            # cancelled run never leaves the output half grouped)
+            self._check_cancelled()
             if self.auto_organize():
                 self._update_progress("Organizing files...")
                 FileOrganizer.group_files_by_tag(self.output_dir, self.progress_callback)
@@ -70,70 +173,159 @@ class VeetechProcessor:
             self._update_progress("Processing complete!")
             return result
 
+        except ProcessingCancelled:
+            self._update_progress("Processing cancelled")
+            raise
+
         except Exception as e:
-            self.logger.error(f"Pipeline failed: {e}")
+            self._log_error(f"Pipeline failed: {e}")
             self._update_progress(f"Error: {str(e)}")
             raise
 
         finally:
             # Cleanup temporary files
-            if Path(self.split_dir).exists():
-                shutil.rmtree(self.split_dir)
-            if Path(self.ocr_output).exists():
-                os.remove(self.ocr_output)
+            if self._split_dir_created:
+                shutil.rmtree(self.split_dir, ignore_errors=True)
+            if self._ocr_output_created:
+                try:
+                    os.remove(self.ocr_output)
+                except FileNotFoundError:
+                    pass
+
+    def _prepare_output_dir(self) -> None:
+        """Create the output directory and check that files can be written to it."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        with tempfile.TemporaryFile(dir=self.output_dir):
+            pass
 
-    def _update_progress(self, message: str):
-        """Update progress callback if available."""
+    def _clear_output_dir(self) -> None:
+        """Remove previous output from the output directory, keeping the directory."""
+        with os.scandir(self.output_dir) as it:
+            entries = list(it)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path, ignore_errors=True)
+            else:
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+    def _update_progress(self, message: str, fraction: Optional[float] = None):
+        """Update progress callback if available, with the fraction done if known."""
+        if self.progress_callback:
+            if fraction is None:
+                self.progress_callback(message)
+            else:
+                self.progress_callback(message, fraction)
+        self._log_info(message)
+
+    def _check_cancelled(self) -> None:
+        """Raise ProcessingCancelled if cancellation was requested."""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise ProcessingCancelled()
+
+    def _report_stage(self, message: str) -> None:
+        """Progress callback for OCR and splitting that also stops them on cancel."""
+        self._check_cancelled()
         if self.progress_callback:
             self.progress_callback(message)
-        self.logger.info(message)
 
     def _process_chunks_step(self, chunks: List[Tuple[str, int, int]]) -> ProcessingResult:
         successful = 0
         failed = 0
         errors = []
-        existing_filenames: Set[str] = set()
+        # Names from an earlier run into the same folder are taken too, so
+        # nothing already there is overwritten
+        existing_filenames = self._existing_output_names()
+        total = len(chunks)
+        report_every = max(1, total // 100)
+        last_report = 0.0
 
-        for i, (chunk_path, start, end) in enumerate(chunks):
-            try:
-                self._update_progress(f"Processing certificate {i+1}/{len(chunks)}...")
+        # The filename uniqueness check and moves stay serial, in chunk order
+        outcomes = _iter_chunk_metadata([chunk[0] for chunk in chunks])
+        try:
+            for i, ((chunk_path, start, end), outcome) in enumerate(zip(chunks, outcomes)):
+                # Outside the per-chunk handler, so it is not recorded as a failed chunk
+                self._check_cancelled()
+                try:
+                    # Report roughly every 1% (or 0.5 s) instead of on every chunk
+                    now = time.monotonic()
+                    if i % report_every == 0 or now - last_report > 0.5:
+                        last_report = now
+                        self._update_progress(f"Processing certificate {i+1}/{total}...",
+                                              (i + 1) / total)
 
-                text = TextExtractor.extract_text_from_pdf(chunk_path)
-                metadata = MetadataExtractor.extract_all_metadata(text)
-                filename = self._generate_unique_filename(metadata, existing_filenames)
-                existing_filenames.add(filename)
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                    filename = self._generate_unique_filename(outcome, existing_filenames)
+                    existing_filenames.add(filename)
 
-                dest_path = Path(self.output_dir) / filename
-                shutil.move(chunk_path, str(dest_path))
-                successful += 1
+                    dest_path = self._output_dir_path / filename
+                    self._move_file(chunk_path, str(dest_path))
+                    successful += 1
 
-            except Exception as e:
-                failed += 1
-                error_info = (chunk_path, start, end, str(e))
-                errors.append(error_info)
-                self.logger.error(f"Failed on {Path(chunk_path).name} "
-                                  f"(pages {start+1}–{end}): {e}")
-                self._save_failed_chunk(chunk_path, start, end)
+                except Exception as e:
+                    failed += 1
+                    error_info = (chunk_path, start, end, str(e))
+                    errors.append(error_info)
+                    self._log_error(f"Failed on {os.path.basename(chunk_path)} "
+                                    f"(pages {start+1}–{end}): {e}")
+                    self._save_failed_chunk(chunk_path, start, end, existing_filenames)
+        finally:
+            # Stops the extraction pool now, not whenever the generator is collected
+            outcomes.close()
 
         return ProcessingResult(
-            total_chunks=len(chunks),
+            total_chunks=total,
             successful=successful,
             failed=failed,
             errors=errors
         )
 
+    def _existing_output_names(self) -> Set[str]:
+        """Names of the files already in the output directory and its tag folders."""
+        names: Set[str] = set()
+        for _, _, files in os.walk(self.output_dir):
+            names.update(files)
+        return names
+
     def _generate_unique_filename(self, metadata: CertificateMetadata,
                                   existing_files: Set[str]) -> str:
         filename = FilenameGenerator.create_filename(metadata, force_serial=False)
         if filename in existing_files:
             filename = FilenameGenerator.create_filename(metadata, force_serial=True)
-        return filename
+        return self._numbered_if_taken(filename, existing_files)
+
+    @staticmethod
+    def _numbered_if_taken(filename: str, existing_files: Set[str]) -> str:
+        """Return filename, or "<stem>_<n><ext>" with the lowest free n >= 2 if it is taken."""
+        if filename not in existing_files:
+            return filename
+        stem, ext = os.path.splitext(filename)
+        n = 2
+        while f"{stem}_{n}{ext}" in existing_files:
+            n += 1
+        return f"{stem}_{n}{ext}"
 
-    def _save_failed_chunk(self, chunk_path: str, start: int, end: int) -> None:
-        base_name = Path(chunk_path).stem
-        failed_filename = f"{base_name}_pages_{start+1}-{end}.pdf"
-        dest_path = Path(self.output_dir) / failed_filename
-        shutil.move(chunk_path, str(dest_path))
+    def _save_failed_chunk(self, chunk_path: str, start: int, end: int,
+                           existing_files: Set[str]) -> None:
+        base_name = os.path.splitext(os.path.basename(chunk_path))[0]
+        failed_filename = self._numbered_if_taken(f"{base_name}_pages_{start+1}-{end}.pdf",
+                                                  existing_files)
+        existing_files.add(failed_filename)
+        dest_path = self._output_dir_path / failed_filename
+        self._move_file(chunk_path, str(dest_path))
+
+    @staticmethod
+    def _move_file(src: str, dst: str) -> None:
+        """Rename src to dst, falling back to copy+delete across devices."""
+        try:
+            os.replace(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(src, dst)
 
     def auto_organize(self) -> bool:
         return True  # or read from a setting if you want this toggleable
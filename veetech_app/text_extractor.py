@@ -1,20 +1,49 @@
 # veetech_app/text_extractor.py
 
+from typing import Union
 import fitz  # PyMuPDF
 from .ocr_processor import OCRProcessor
 
+STOP_CHECK_PAGES = 3  # pages after which stop_when is no longer consulted
+
 class TextExtractor:
     """Handles text extraction from PDFs."""
 
     @staticmethod
-    def extract_text_from_pdf(pdf_path: str) -> str:
-        """Extract and correct text from PDF."""
-        doc = fitz.open(pdf_path)
+    def extract_text_from_pdf(pdf: Union[str, "fitz.Document"], stop_when=None) -> str:
+        """
+        Extract and correct text from PDF, given as a path or an open fitz.Document.
+        A document passed in is left open for the caller to reuse.
+        If stop_when is given, pages stop being read once stop_when(text so far)
+        returns True. It is only asked for the first STOP_CHECK_PAGES pages:
+        each call rescans all text so far, so checking every page of a long
+        chunk missing a field would cost quadratic time.
+        """
+        owns_doc = not isinstance(pdf, fitz.Document)
+        doc = fitz.open(pdf) if owns_doc else pdf
         try:
-            raw_text = "".join(page.get_text() for page in doc)
-            if not raw_text.strip():
+            # Correct page by page so only one page of raw text is alive at a time;
+            # the fix-ups target tags and title lines, which do not straddle pages
+            correct = OCRProcessor.correct_ocr_errors
+            if stop_when is None:
+                text = "".join([correct(page.get_text()) for page in doc])
+            else:
+                pages = []
+                text = None
+                for page in doc:
+                    pages.append(correct(page.get_text()))
+                    if len(pages) <= STOP_CHECK_PAGES:
+                        # Joined for the check and reused if it says to stop
+                        text = "".join(pages)
+                        if stop_when(text):
+                            break
+                    text = None
+                if text is None:
+                    text = "".join(pages)
+            if not text.strip():
                 raise ValueError("No text extracted from PDF")
-            # print(f"\n\nText: {raw_text[:3000]}...\n\n")  # Debug output
-            return OCRProcessor.correct_ocr_errors(raw_text)
+            # print(f"\n\nText: {text[:3000]}...\n\n")  # Debug output
+            return text
         finally:
-            doc.close()
+            if owns_doc:
+                doc.close()
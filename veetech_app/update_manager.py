@@ -1,13 +1,43 @@
 # veetech_app/update_manager.py
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from packaging.version import InvalidVersion, Version
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
 import webbrowser
 import re
 import threading
+import queue
 import tkinter as tk
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Optional, Tuple
 from tkinter import messagebox
 from .config import AppConfig
 
+# POINT THIS at your GitHub Releases "latest" API endpoint.
+GITHUB_REPO = "noelmathen/veetech-pdf-processor"
+LATEST_RELEASE_URL = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB per read keeps the download loop out of Python
+PROGRESS_INTERVAL = 0.25       # seconds between download progress messages
+UPDATE_CACHE_TTL = 6 * 3600    # seconds a successful update check is reused
+CHECK_TIMEOUT = (3, 5)         # (connect, read) seconds for the release lookup
+RECHECK_INTERVAL = 15 * 60     # seconds an explicit check reuses this session's last answer
+GITHUB_TOKEN_ENV = "GITHUB_TOKEN"  # optional token for authenticated release lookups
+SETUP_SUFFIX = "-setup.exe"    # lowercased suffix of the installer asset's name
+CHECKSUMS_ASSET = "SHA256SUMS.txt"  # release asset listing "<sha256>  <file name>" lines
+
+class UpdateVerificationError(Exception):
+    """Raised when a downloaded installer does not match its published checksum."""
+
 class UpdateManager:
     """
     Manages checking for updates via GitHub Releases.
@@ -20,31 +50,193 @@ class UpdateManager:
         """
         self.config = config
         self.root = root_window
-        # POINT THIS at your GitHub Releases "latest" API endpoint.
-        self.github_api_latest = "https://api.github.com/repos/noelmathen/veetech-pdf-processor/releases/latest"
+        self.github_api_latest = LATEST_RELEASE_URL
+        self.cache_file = f"{config.config_file}.update_cache.json"
+        # (time.monotonic(), result) of the last error-free check in this session
+        self._last_check: Optional[Tuple[float, dict]] = None
+        # Background jobs, served by one daemon thread started on first submit
+        self._jobs: Optional[queue.Queue] = None
+        self._jobs_lock = threading.Lock()
+        # Pending background check, shared by overlapping callers
+        self._inflight_check: Optional[Future] = None
+        self._inflight_lock = threading.Lock()
+        # The check whose result prompt_and_update has already arranged to show
+        self._prompted_check: Optional[Future] = None
+        # Held for a whole installer download, see download_update
+        self._download_lock = threading.Lock()
+        # Set to stop the current installer prefetch, see prefetch_update
+        self._prefetch_cancel: Optional[threading.Event] = None
 
-    @staticmethod
-    def parse_version(tag: str) -> tuple[int, ...]:
-        """
-        Convert a version string like "v1.2.3" or "1.2.3" into a tuple of ints: (1, 2, 3).
-        - Ignores any leading "v" or "V".
-        - Splits on dots.
-        """
-        if tag.lower().startswith("v"):
-            tag = tag[1:]
-        parts = tag.split(".")
-        # Convert each part to int if possible, else 0
-        nums = []
-        for p in parts:
+        # One pooled session so repeat checks and the download reuse a TLS connection
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=2,
+            # Transient gateway errors are retried too, not just connection failures
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+        )
+        self._session.mount("https://", adapter)
+        # Sent on every request, so individual calls don't pass headers
+        # (requests already asks for gzip/deflate bodies by default)
+        self._session.headers.update({
+            "Accept": "application/vnd.github+json",
+            "User-Agent": f"{config.app_name}/{config.version}",
+        })
+        # A token raises GitHub's limit from 60 to 5000 requests an hour
+        token = os.environ.get(GITHUB_TOKEN_ENV)
+        if token:
+            self._session.headers["Authorization"] = f"Bearer {token}"
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """
+        Run fn(*args, **kwargs) on the manager's background thread and return
+        a Future for its result. One daemon thread serves every check and
+        download, so no thread is started per request and none delays exit.
+        """
+        with self._jobs_lock:
+            if self._jobs is None:
+                self._jobs = queue.Queue()
+                threading.Thread(target=self._run_jobs, name="update-worker",
+                                 daemon=True).start()
+        future = Future()
+        self._jobs.put((future, fn, args, kwargs))
+        return future
+
+    def _run_jobs(self):
+        """Background thread loop: run submitted jobs in order."""
+        while True:
+            future, fn, args, kwargs = self._jobs.get()
+            if not future.set_running_or_notify_cancel():
+                continue
             try:
-                nums.append(int(p))
-            except ValueError:
-                nums.append(0)
-        return tuple(nums)
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+
+    def close(self):
+        """Close the pooled HTTP session."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def parse_version(tag: str) -> Version:
+        """
+        Parse a version string like "v1.2.3" or "1.2.3" (leading "v"/"V" ignored)
+        into a comparable packaging Version; unparseable tags count as 0.
+        Cached: every check parses the same running version again.
+        """
+        try:
+            return Version(tag.lstrip("vV"))
+        except InvalidVersion:
+            return Version("0")
+
+    def _read_cache(self) -> Optional[dict]:
+        """Load the cache file if it was written by this version, else None."""
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cache, dict) or cache.get("version") != self.config.version:
+            return None
+        return cache
+
+    def cached_update_info(self) -> Optional[dict]:
+        """
+        Return the last successful check result if it is younger than
+        UPDATE_CACHE_TTL and was made by this version, else None.
+        """
+        cache = self._read_cache()
+        if cache is None:
+            return None
+        checked_at = cache.get("checked_at", 0)
+        if not 0 <= time.time() - checked_at < UPDATE_CACHE_TTL:
+            return None
+        return cache.get("payload")
+
+    def _store_update_info(self, result: dict, etag: Optional[str] = None,
+                           last_modified: Optional[str] = None) -> None:
+        """Write a check result and its validators to the cache file atomically."""
+        cache = {"checked_at": time.time(), "version": self.config.version,
+                 "payload": result, "etag": etag, "last_modified": last_modified}
+        tmp_path = f"{self.cache_file}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.cache_file)
+        except OSError:
+            # The cache only saves a request; failing to write it is harmless
+            pass
 
-    def check_for_updates(self) -> dict:
+    def check_for_updates(self, use_cache: bool = True, force: bool = False) -> dict:
         """
-        Check GitHub for the latest release. Returns a dict:
+        Check for the latest release, reusing a recent cached result unless
+        use_cache is False. Only error-free results are cached.
+        Even without use_cache, repeat checks within RECHECK_INTERVAL reuse
+        this session's last answer; force always asks GitHub.
+        Running from source (not a frozen build) there is no installer to
+        update, so no request is made at all.
+        """
+        if not getattr(sys, "frozen", False):
+            return {"update_available": False, "latest_version": self.config.version,
+                    "download_url": None, "error": None}
+        if not force and self._last_check is not None:
+            checked_at, result = self._last_check
+            if time.monotonic() - checked_at < RECHECK_INTERVAL:
+                return result
+        if use_cache and not force:
+            cached = self.cached_update_info()
+            if cached is not None:
+                return cached
+        result, etag, last_modified = self._fetch_update_info(self._read_cache())
+        if not result.get("error"):
+            self._store_update_info(result, etag, last_modified)
+            self._last_check = (time.monotonic(), result)
+        return result
+
+    def _fetch_update_info(self, cache: Optional[dict] = None
+                           ) -> Tuple[dict, Optional[str], Optional[str]]:
+        """
+        Ask GitHub for the latest release; returns (result, ETag, Last-Modified).
+        A cached result is revalidated with a conditional request, so an
+        unchanged release costs a bodiless 304 that does not count against
+        GitHub's rate limit, and the cached result is returned as is.
+        """
+        headers = {}
+        if cache and cache.get("payload") is not None:
+            if cache.get("etag"):
+                headers["If-None-Match"] = cache["etag"]
+            if cache.get("last_modified"):
+                headers["If-Modified-Since"] = cache["last_modified"]
+        try:
+            resp = self._session.get(self.github_api_latest, headers=headers,
+                                     timeout=CHECK_TIMEOUT)
+            if resp.status_code == 304:
+                return (cache["payload"], resp.headers.get("ETag", cache.get("etag")),
+                        resp.headers.get("Last-Modified", cache.get("last_modified")))
+            resp.raise_for_status()
+            result = self._release_info(resp.json())
+            return result, resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+
+        except requests.RequestException as e:
+            error = f"Network error: {e}"
+        except ValueError as e:
+            # JSON parsing error
+            error = f"Invalid JSON: {e}"
+        except Exception as e:
+            error = str(e)
+        return ({"update_available": False, "latest_version": None,
+                 "download_url": None, "error": error}, None, None)
+
+    def _release_info(self, data: dict) -> dict:
+        """
+        Turn a GitHub release payload into a dict:
           {
             "update_available": True/False,
             "latest_version": "vX.Y.Z",
@@ -52,67 +244,268 @@ class UpdateManager:
             "error": None or "<error message>"
           }
         """
-        try:
-            resp = requests.get(self.github_api_latest, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-
-            # Example: "tag_name": "v1.2.3"
-            latest_tag = data.get("tag_name", "")
-            if not latest_tag:
-                return {"update_available": False, "latest_version": None,
-                        "download_url": None, "error": "No tag_name in response."}
-
-            latest_ver_tuple = UpdateManager.parse_version(latest_tag)
-            current_ver_tuple = UpdateManager.parse_version(self.config.version)
-
-            if latest_ver_tuple > current_ver_tuple:
-                # Find the Setup.exe asset
-                assets = data.get("assets", [])
-                download_url = None
-                for asset in assets:
-                    name = asset.get("name", "")
-                    if name.lower().endswith("-setup.exe"):
-                        download_url = asset.get("browser_download_url")
-                        break
-
-                if not download_url:
-                    return {
-                        "update_available": False,
-                        "latest_version": latest_tag,
-                        "download_url": None,
-                        "error": "No Setup.exe asset found in release."
-                    }
+        # Example: "tag_name": "v1.2.3"
+        latest_tag = data.get("tag_name", "")
+        if not latest_tag:
+            return {"update_available": False, "latest_version": None,
+                    "download_url": None, "error": "No tag_name in response."}
 
+        latest_version = UpdateManager.parse_version(latest_tag)
+        current_version = UpdateManager.parse_version(self.config.version)
+
+        if latest_version > current_version:
+            # Index assets by name once; the checksums file is then a dict lookup
+            assets = {asset.get("name", ""): asset.get("browser_download_url")
+                      for asset in data.get("assets", [])}
+            # First asset (in release order) that is the Setup.exe
+            download_url = next((url for name, url in assets.items()
+                                 if name.lower().endswith(SETUP_SUFFIX)), None)
+            checksums_url = assets.get(CHECKSUMS_ASSET)
+
+            if not download_url:
                 return {
-                    "update_available": True,
+                    "update_available": False,
                     "latest_version": latest_tag,
-                    "download_url": download_url,
-                    "error": None
+                    "download_url": None,
+                    "error": "No Setup.exe asset found in release."
                 }
 
-            # No update needed
-            return {"update_available": False, "latest_version": latest_tag,
-                    "download_url": None, "error": None}
+            return {
+                "update_available": True,
+                "latest_version": latest_tag,
+                "download_url": download_url,
+                "checksums_url": checksums_url,
+                "error": None
+            }
 
-        except requests.RequestException as e:
-            return {"update_available": False, "latest_version": None,
-                    "download_url": None, "error": f"Network error: {e}"}
-        except ValueError as e:
-            # JSON parsing error
-            return {"update_available": False, "latest_version": None,
-                    "download_url": None, "error": f"Invalid JSON: {e}"}
-        except Exception as e:
-            return {"update_available": False, "latest_version": None,
-                    "download_url": None, "error": str(e)}
+        # No update needed
+        return {"update_available": False, "latest_version": latest_tag,
+                "download_url": None, "error": None}
+
+    def _installer_path(self, update_url: str) -> str:
+        """Fixed temp path for the installer at update_url, so a retry can resume it."""
+        name = os.path.basename(update_url.split("?", 1)[0]) or "installer.exe"
+        return os.path.join(tempfile.gettempdir(), f"{self.config.app_name}-update-{name}")
+
+    def expected_sha256(self, update_info: dict) -> Optional[str]:
+        """
+        Look up the installer's SHA-256 in the release's CHECKSUMS_ASSET, or
+        None if the release publishes none or does not list the installer.
+        """
+        checksums_url = update_info.get("checksums_url")
+        if not checksums_url or not update_info.get("download_url"):
+            return None
+        name = os.path.basename(update_info["download_url"].split("?", 1)[0])
+        resp = self._session.get(checksums_url, timeout=CHECK_TIMEOUT)
+        resp.raise_for_status()
+        for line in resp.text.splitlines():
+            parts = line.split()
+            # "<digest>  <name>", or "<digest> *<name>" for binary mode
+            if len(parts) == 2 and parts[1].lstrip("*") == name:
+                return parts[0].lower()
+        return None
+
+    def prefetch_update(self, update_url: str) -> None:
+        """
+        Start downloading the installer in the background, e.g. while the user
+        reads the update prompt. A later download_update of the same URL then
+        only checks that the file is complete; discard_prefetch undoes it.
+        """
+        self._prefetch_cancel = threading.Event()
+        self.submit(self.download_update, update_url, cancel=self._prefetch_cancel)
+
+    def stop_prefetch(self) -> None:
+        """
+        Stop the current prefetch, keeping its partial file for download_update
+        to resume. A prefetch reports no progress, so a download the user is
+        waiting for should not queue behind it.
+        """
+        if self._prefetch_cancel is not None:
+            self._prefetch_cancel.set()
+            self._prefetch_cancel = None
+
+    def discard_prefetch(self, update_url: str) -> None:
+        """Stop a prefetch of update_url and delete what it downloaded."""
+        self.stop_prefetch()
+        # Queued behind the prefetch, so the files are no longer being written
+        self.submit(self._remove_download, update_url)
+
+    def _remove_download(self, update_url: str) -> None:
+        """Delete the installer file for update_url and its resume metadata."""
+        path = self._installer_path(update_url)
+        for leftover in (path, f"{path}.meta"):
+            try:
+                os.remove(leftover)
+            except FileNotFoundError:
+                pass
+
+    def download_update(self, update_url: str, progress_callback=None,
+                        sha256: Optional[str] = None,
+                        cancel: Optional[threading.Event] = None) -> str:
+        """
+        Download the installer at update_url into a temp file and return its path.
+        A partial or earlier download of the same file is resumed with a Range
+        request, guarded by If-Range so a changed file on the server is fetched
+        in full; an already complete file costs one bodiless 416 response.
+        If sha256 is given, the bytes are hashed as they arrive and a mismatch
+        deletes the file and raises UpdateVerificationError.
+        Setting cancel stops the download with InterruptedError, keeping the
+        partial file for a later resume.
+        Progress messages are throttled to one every PROGRESS_INTERVAL seconds;
+        without a callback, checksum or cancel event the body is copied
+        straight to disk by shutil.
+        """
+        # Callers on other threads wait rather than write the same file at once
+        with self._download_lock:
+            return self._download(update_url, progress_callback, sha256, cancel)
+
+    def _download(self, update_url: str, progress_callback, sha256: Optional[str],
+                  cancel: Optional[threading.Event]) -> str:
+        """download_update without the lock."""
+        path = self._installer_path(update_url)
+        meta_path = f"{path}.meta"
+        offset = 0
+        headers = {}
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("url") == update_url and meta.get("validator"):
+                offset = os.path.getsize(path)
+                if offset:
+                    headers = {"Range": f"bytes={offset}-", "If-Range": meta["validator"]}
+        except (OSError, ValueError, AttributeError):
+            offset = 0
+
+        digest = hashlib.sha256() if sha256 else None
+        with self._session.get(update_url, stream=True, headers=headers,
+                               timeout=(5, 30)) as response:
+            content_range = response.headers.get("Content-Range", "")
+            if response.status_code == 416 and headers:
+                if content_range != f"bytes */{offset}":
+                    # Forget the partial file so the next attempt starts over
+                    os.remove(meta_path)
+                    response.raise_for_status()
+                # Nothing past what is on disk: the file is already complete
+                if digest is not None:
+                    UpdateManager._hash_file(path, digest)
+                return self._verified(path, meta_path, digest, sha256)
+
+            response.raise_for_status()
+            resumed = (response.status_code == 206
+                       and content_range.startswith(f"bytes {offset}-"))
+            if not resumed:
+                offset = 0
+                if response.status_code == 206:
+                    os.remove(meta_path)
+                    raise requests.HTTPError("Server returned an unexpected byte range")
+            total_size = int(response.headers.get("content-length", 0))
+            if total_size > 0:
+                total_size += offset
+
+            # Only a plain body with a validator can be resumed later
+            validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+            if validator and not response.headers.get("Content-Encoding"):
+                with open(meta_path, "w", encoding="utf-8") as f:
+                    json.dump({"url": update_url, "validator": validator}, f)
+            else:
+                try:
+                    os.remove(meta_path)
+                except FileNotFoundError:
+                    pass
+
+            if digest is not None and resumed:
+                # Only a resumed download re-reads anything: the part already on disk
+                UpdateManager._hash_file(path, digest)
+            report = progress_callback is not None and total_size > 0
+
+            # Not preallocated: after an interruption the file size must be
+            # exactly the bytes received, since that is the resume offset
+            with open(path, "ab" if resumed else "wb") as f:
+                if digest is None and not report and cancel is None:
+                    response.raw.decode_content = True
+                    shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+                else:
+                    downloaded = offset
+                    last_report = 0.0
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if cancel is not None and cancel.is_set():
+                            raise InterruptedError("Update download cancelled")
+                        f.write(chunk)
+                        # Hashed while the chunk is in memory, so checking costs no extra read
+                        if digest is not None:
+                            digest.update(chunk)
+                        if not report:
+                            continue
+                        downloaded += len(chunk)
+                        now = time.monotonic()
+                        if now - last_report >= PROGRESS_INTERVAL or downloaded >= total_size:
+                            last_report = now
+                            progress = (downloaded / total_size) * 100
+                            progress_callback(f"Downloading update... {progress:.1f}%")
+
+        return self._verified(path, meta_path, digest, sha256)
+
+    @staticmethod
+    def _hash_file(path: str, digest) -> None:
+        """Feed the contents of path into digest."""
+        with open(path, "rb") as f:
+            while block := f.read(DOWNLOAD_CHUNK_SIZE):
+                digest.update(block)
+
+    @staticmethod
+    def _verified(path: str, meta_path: str, digest, sha256: Optional[str]) -> str:
+        """Return path if digest matches sha256 (or there is none), else delete it and raise."""
+        if digest is not None and digest.hexdigest() != sha256.lower():
+            for leftover in (path, meta_path):
+                try:
+                    os.remove(leftover)
+                except FileNotFoundError:
+                    pass
+            raise UpdateVerificationError("Downloaded installer failed checksum verification")
+        return path
+
+    def apply_update(self, update_file: str) -> bool:
+        """
+        Launch the downloaded installer as a detached process.
+        /CLOSEAPPLICATIONS lets Inno Setup shut down the running app before it
+        replaces files, so no helper script or fixed wait is needed.
+        """
+        flags = 0
+        if sys.platform == "win32":
+            flags = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        try:
+            subprocess.Popen([update_file, "/CLOSEAPPLICATIONS"],
+                             creationflags=flags, close_fds=True)
+            return True
+        except OSError:
+            return False
+
+    def check_in_background(self, use_cache: bool = True) -> Future:
+        """
+        Run check_for_updates on the background thread. While a check is still
+        pending, callers get that check's Future instead of starting another.
+        """
+        with self._inflight_lock:
+            inflight = self._inflight_check
+            if inflight is None or inflight.done():
+                inflight = self.submit(self.check_for_updates, use_cache=use_cache)
+                self._inflight_check = inflight
+            return inflight
 
     def prompt_and_update(self):
         """
         Perform the check in a background thread, then prompt the user if new version found.
         Must be called from the main thread (e.g. in response to a menu click).
         """
-        def worker():
-            result = self.check_for_updates()
+        # An explicit check skips the disk cache (repeat clicks still reuse the last answer)
+        future = self.check_in_background(use_cache=False)
+        if future is self._prompted_check:
+            # A click while this check is pending; it already shows its result once
+            return
+        self._prompted_check = future
+
+        def done(future):
+            result = future.result()
             # Use root.after so the messagebox is shown on the main thread
             if self.root:
                 self.root.after(0, lambda: self._show_result(result))
@@ -120,7 +513,7 @@ class UpdateManager:
                 # If no root was provided, show immediately (may block)
                 self._show_result(result)
 
-        threading.Thread(target=worker, daemon=True).start()
+        future.add_done_callback(done)
 
     def _show_result(self, result: dict):
         """